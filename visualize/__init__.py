@@ -0,0 +1,12 @@
+"""Visualize - CSV, Excel, JSON ve TXT dosyaları için interaktif görselleştirme aracı.
+
+Modüller:
+    main: Komut satırı giriş noktası (python -m visualize.main).
+    cli: İnteraktif dosya seçimi ve CLI akışı.
+    file: Dosya validasyonu ve veri okuma.
+    visualize: Grafik stratejileri ve görselleştirme workflow'u.
+
+Note:
+    Paket import edilirken alt modüller yüklenmez; matplotlib ve pandas
+    sadece ilgili modül import edildiğinde yüklenir.
+"""
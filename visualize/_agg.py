@@ -0,0 +1,146 @@
+"""Çizim öncesi büyük seriler için toplama (aggregation) çekirdekleri.
+
+Milyonlarca satırlık çubuk grafiklerinde aynı kategorideki değerler tek bir
+çubukta toplanır. numba yüklüyse toplama JIT derlenmiş, çok çekirdekli bir
+döngüyle yapılır; yüklü değilse np.bincount kullanılır.
+
+Functions:
+    group_sum: Değerleri anahtara göre toplar (groupby(...).sum() eşdeğeri).
+    histogram: Eşit genişlikli kutularda frekans sayar (np.histogram eşdeğeri).
+"""
+
+import numpy as np
+import pandas as pd
+
+# numba opsiyoneldir: toplama döngüsünü derleyip tüm çekirdeklerde çalıştırır.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def _group_sum_kernel(
+        codes: np.ndarray, values: np.ndarray, n_groups: int, n_chunks: int
+    ) -> np.ndarray:
+        """Her thread kendi parçasını ayrı bir satıra toplar, sonra satırlar birleşir.
+
+        Aynı çıktı hücresine birden fazla thread'in yazmaması için kısmi
+        toplamlar (n_chunks, n_groups) dizisinde tutulur.
+        """
+        partial = np.zeros((n_chunks, n_groups))
+        chunk = (codes.size + n_chunks - 1) // n_chunks
+        for c in numba.prange(n_chunks):
+            start = c * chunk
+            end = min(start + chunk, codes.size)
+            for i in range(start, end):
+                code = codes[i]
+                value = values[i]
+                if code >= 0 and not np.isnan(value):
+                    partial[c, code] += value
+        return partial.sum(axis=0)
+
+    @numba.njit(cache=True, parallel=True)
+    def _histogram_kernel(
+        values: np.ndarray, edges: np.ndarray, n_chunks: int
+    ) -> np.ndarray:
+        """Eşit genişlikli kutularda sayım; NaN değerler atlanır.
+
+        Kutu indeksi np.histogram ile aynı şekilde hesaplanır ve kenar
+        değerlerindeki yuvarlama hataları edges ile karşılaştırılarak
+        düzeltilir; son kutu sağdan kapalıdır.
+        """
+        n_bins = edges.size - 1
+        lo = edges[0]
+        hi = edges[-1]
+        norm = n_bins / (hi - lo)
+        partial = np.zeros((n_chunks, n_bins), dtype=np.int64)
+        chunk = (values.size + n_chunks - 1) // n_chunks
+        for c in numba.prange(n_chunks):
+            start = c * chunk
+            end = min(start + chunk, values.size)
+            for i in range(start, end):
+                value = values[i]
+                if np.isnan(value) or value < lo or value > hi:
+                    continue
+                index = int((value - lo) * norm)
+                if index == n_bins:
+                    index -= 1
+                if value < edges[index]:
+                    index -= 1
+                elif index != n_bins - 1 and value >= edges[index + 1]:
+                    index += 1
+                partial[c, index] += 1
+        return partial.sum(axis=0)
+
+
+def group_sum(keys: pd.Series, values: pd.Series) -> pd.Series:
+    """Değerleri anahtara göre toplar.
+
+    Sonuç, keys.groupby(sort=False, observed=True) ile aynı sırada (ilk
+    görülme sırası) döner. Eksik anahtarlar atlanır, eksik değerler 0
+    sayılır.
+
+    Args:
+        keys (pd.Series): Gruplama kolonu (X ekseni).
+        values (pd.Series): Toplanacak sayısal kolon (Y ekseni).
+
+    Returns:
+        pd.Series: Anahtar başına toplam (float64), index'i anahtarlar.
+
+    Example:
+        >>> group_sum(pd.Series(["a", "b", "a"]), pd.Series([1, 2, 3]))
+        a    4.0
+        b    2.0
+        dtype: float64
+    """
+    codes, uniques = pd.factorize(keys, sort=False)
+    array = values.to_numpy(dtype="float64", na_value=np.nan)
+
+    if numba is not None:
+        sums = _group_sum_kernel(codes, array, len(uniques), numba.get_num_threads())
+    else:
+        mask = (codes >= 0) & ~np.isnan(array)
+        sums = np.bincount(codes[mask], weights=array[mask], minlength=len(uniques))
+
+    return pd.Series(sums, index=uniques, name=values.name)
+
+
+def histogram(values: pd.Series, bins: int) -> tuple[np.ndarray, np.ndarray]:
+    """Seriyi eşit genişlikli kutulara ayırıp frekansları sayar.
+
+    Eksik değerler atlanır; dropna() kopyası sadece seride gerçekten eksik
+    değer varsa (numba yokken) oluşturulur. numba yüklüyse sayım tek geçişte
+    ve çok çekirdekli yapılır.
+
+    Args:
+        values (pd.Series): Sayısal kolon.
+        bins (int): Kutu sayısı.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Kutu başına sayılar ve bins + 1 kenar
+            (np.histogram ile aynı).
+
+    Example:
+        >>> counts, edges = histogram(pd.Series([1.0, 2.0, None, 2.0]), 2)
+        >>> counts
+        array([1, 2])
+    """
+    array = values.to_numpy(dtype="float64", na_value=np.nan)
+    missing = np.isnan(array)
+
+    if numba is None or missing.all():
+        if missing.any():
+            array = array[~missing]
+        return np.histogram(array, bins=bins)
+
+    lo, hi = np.nanmin(array), np.nanmax(array)
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        # Sonsuz değerlerde np.histogram'ın kendi hata mesajı korunur
+        return np.histogram(array[~missing], bins=bins)
+
+    edges = np.histogram_bin_edges(np.array([lo, hi]), bins=bins)
+    counts = _histogram_kernel(array, edges, numba.get_num_threads())
+    return counts, edges
@@ -0,0 +1,105 @@
+"""Çizgi grafikleri için LTTB (Largest-Triangle-Three-Buckets) seyreltme.
+
+Ekran yatayda sadece figür genişliği kadar piksel gösterebildiği için çok
+uzun seriler, görsel olarak eşdeğer daha az noktaya indirgenerek çizilir.
+LTTB, her kovadan bir önceki seçilen nokta ve bir sonraki kovanın
+ortalamasıyla en büyük üçgeni oluşturan noktayı seçer; tepe ve çukurlar
+korunur.
+
+Functions:
+    lttb: numpy dizileri üzerinde LTTB.
+    lttb_series: pandas serilerini (sayısal veya datetime X) seyreltir.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def lttb(xs: np.ndarray, ys: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Seriyi LTTB ile n_out noktaya indirger.
+
+    Kova içi alan hesabı numpy ile vektörize edilir; Python döngüsü sadece
+    kova sayısı (n_out) kadar döner.
+
+    Args:
+        xs (np.ndarray): X değerleri (float64, sıralı).
+        ys (np.ndarray): Y değerleri (float64).
+        n_out (int): Hedef nokta sayısı.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Seçilen X ve Y değerleri. n_out seri
+            uzunluğundan büyükse veya 3'ten küçükse seri aynen döner.
+
+    Example:
+        >>> xs = np.arange(10_000, dtype="float64")
+        >>> sx, sy = lttb(xs, np.sin(xs / 100), 500)
+        >>> len(sx)
+        500
+    """
+    n = len(xs)
+    if n_out >= n or n_out < 3:
+        return xs, ys
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    bucket_size = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Sonraki kovanın ortalaması; son kova için son nokta kullanılır
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        if next_end <= next_start:
+            next_start, next_end = n - 1, n
+        avg_x = xs[next_start:next_end].mean()
+        avg_y = ys[next_start:next_end].mean()
+
+        area = np.abs(
+            (xs[a] - avg_x) * (ys[start:end] - ys[a])
+            - (xs[a] - xs[start:end]) * (avg_y - ys[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+
+    return xs[selected], ys[selected]
+
+
+def lttb_series(
+    x: pd.Series, y: pd.Series, n_out: int
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """pandas serilerini LTTB ile seyreltir.
+
+    Eksik değer içeren satırlar atılır. Datetime X ekseni int64 nanosaniyeye
+    çevrilerek seyreltilir ve sonra tekrar datetime64'e dönüştürülür.
+
+    Args:
+        x (pd.Series): X ekseni serisi.
+        y (pd.Series): Y ekseni serisi.
+        n_out (int): Hedef nokta sayısı.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray] | None: Seyreltilmiş X ve Y değerleri.
+            X veya Y sayısal/datetime değilse (örn. kategorik) None.
+    """
+    is_datetime = pd.api.types.is_datetime64_any_dtype(x)
+    if not (is_datetime or pd.api.types.is_numeric_dtype(x)):
+        return None
+    if not pd.api.types.is_numeric_dtype(y):
+        return None
+
+    mask = x.notna() & y.notna()
+    x, y = x[mask], y[mask]
+
+    if is_datetime:
+        xs = x.to_numpy(dtype="datetime64[ns]").astype("int64").astype("float64")
+    else:
+        xs = x.to_numpy(dtype="float64")
+    sx, sy = lttb(xs, y.to_numpy(dtype="float64"), n_out)
+
+    if is_datetime:
+        sx = sx.astype("int64").astype("datetime64[ns]")
+    return sx, sy
@@ -12,7 +12,7 @@ Classes:
 Example:
     Temel kullanım::
 
-        from cli import CLI, CLIConfig
+        from visualize.cli import CLI, CLIConfig
         
         # Konfigürasyon oluştur
         config = CLIConfig(path="./my_data")
@@ -24,14 +24,41 @@ Example:
 
 import os
 import sys
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-from file import File
-from InquirerPy import inquirer
+from .file import File, FileValidationError
 
-from visualize import VisualizationWorkflow
+if TYPE_CHECKING:
+    from InquirerPy.base.control import Choice
+
+_BANNER = r"""
+           ╦  ╦╦╔═╗╦ ╦╔═╗╦  ╦╔═╗╔═╗
+           ╚╗╔╝║╚═╗║ ║╠═╣║  ║╔═╝║╣
+            ╚╝ ╩╚═╝╚═╝╩ ╩╩═╝╩╚═╝╚═╝
+                   """
+_SUBTITLE = "Visualize is a toolchain for data visualization"
+_SEPARATOR = "=" * 50
+_ACTIONS = (
+    "\tFor selection press [Space]\n"
+    + "\tFor move press [Up] or [Down]\n"
+    + "\tFor answer press [Enter]\n"
+    + "\tFor exit press [q]\n"
+)
+
+# Çalışma zamanına bağlı olmayan her şey import anında formatlanır ve
+# UTF-8'e encode edilir; intro() sadece GitHub linki ve klasör yolunu
+# yerleştirip tek flush ile yazar.
+_INTRO_HEAD = "\n" + _BANNER + "\n" + f"{_SUBTITLE:^50}\n" + _SEPARATOR + "\n"
+_INTRO_BODY_TEMPLATE = (
+    "{github_info:^50}\n" + _SEPARATOR + "\n\n" + "📁 Scanning directory: {path}\n"
+)
+_INTRO_TAIL = f"Actions:\n{_ACTIONS:^50}\n"
+_INTRO_HEAD_BYTES = _INTRO_HEAD.encode("utf-8")
+_INTRO_TAIL_BYTES = _INTRO_TAIL.encode("utf-8")
 
 
 @dataclass
@@ -46,7 +73,7 @@ class CLIConfig:
         path (str): Veri dosyalarının bulunduğu klasör yolu.
             Varsayılan "./data".
         recursive (bool): Alt klasörlere de bakılıp bakılmayacağı.
-            Varsayılan False. (ŞU AN IMPLEMENT EDİLMEMİŞ)
+            Varsayılan False.
         max_file (int): Listelenecek maksimum dosya sayısı.
             Varsayılan 100.
     
@@ -59,7 +86,6 @@ class CLIConfig:
         ./mydata
     
     Todo:
-        * Recursive klasör taraması implement edilecek
         * getcwd() kullanarak current path default olarak ayarlanacak
     """
 
@@ -67,11 +93,17 @@ class CLIConfig:
     """Veri dosyalarının bulunduğu klasör yolu. Varsayılan ./data"""
     
     recursive: bool = False
-    """Alt klasörlerin de taranıp taranmayacağı. ŞU AN AKTİF DEĞİL."""
+    """Alt klasörlerin de taranıp taranmayacağı."""
     
     max_file: int = 100
     """Liste lenecek maksimum dosya sayısı."""
 
+    _resolved: str = field(init=False, repr=False)
+    """Path'in mutlak hali. __post_init__() içinde bir kez hesaplanır."""
+
+    _sep_path: str = field(init=False, repr=False)
+    """Sonuna ayraç eklenmiş mutlak path; dosya isimleri doğrudan eklenir."""
+
     def __post_init__(self):
         """Konfigürasyon validasyonu yapar.
         
@@ -87,6 +119,10 @@ class CLIConfig:
         if not os.path.exists(self.path):
             sys.exit(f"An Error occur: {self.path} {CLIError.PathDoesntExist.value}")
 
+        # Base path bir kez çözülür, dosya yolları tek string birleştirme ile üretilir
+        self._resolved = os.path.abspath(self.path)
+        self._sep_path = os.path.join(self._resolved, "")
+
 
 class CLIError(Enum):
     """CLI işlemleri sırasında oluşabilecek hata mesajları.
@@ -140,6 +176,8 @@ class CLI(CLIConfig):
         """
         self.config = config
         self.project_link: str = "https://www.github.com/riqoto/visual"
+        self._entries: dict[str, os.DirEntry] = {}
+        self._files_cache: list["Choice"] | None = None
 
     def create_files_prompt(self) -> list[str]:
         """Kullanıcıya dosya seçimi için interaktif menü gösterir.
@@ -148,7 +186,8 @@ class CLI(CLIConfig):
         En az 1 dosya seçilmesi zorunludur.
         
         Returns:
-            list[str]: Seçilen dosya isimleri listesi.
+            list[str]: Seçilen dosyaların tam yolları listesi. Menüde isimler
+                gösterilir, seçimin değeri ise doğrudan dosya yoludur.
         
         Raises:
             SystemExit: Kullanıcı 'q' ile çıkış yaparsa veya beklenmeyen hata olursa.
@@ -157,7 +196,7 @@ class CLI(CLIConfig):
             >>> cli = CLI(config)
             >>> selected = cli.create_files_prompt()
             >>> print(selected)
-            ['data.csv', 'employees.xlsx']
+            ['/abs/data/data.csv', '/abs/data/employees.xlsx']
         
         Note:
             - Space tuşu ile dosya seçilir
@@ -165,11 +204,14 @@ class CLI(CLIConfig):
             - 'q' ile çıkış yapılır
             - En az 1 dosya seçilmesi zorunludur
         """
+        # InquirerPy (prompt_toolkit) ağır bir import; sadece prompt gerektiğinde yüklenir
+        from InquirerPy import inquirer
+
         files = []
         try:
             files = inquirer.checkbox(
                 message="Select file/files to visualize [press space for selection]",
-                choices=[file for file in self.get_files()],
+                choices=self.get_files(),
                 validate=lambda result: len(result) >= 1,
                 invalid_message="Please select one file or more",
                 border=True,
@@ -187,46 +229,108 @@ class CLI(CLIConfig):
         # Kullanıcı ya çıkış yapar ya da en az 1 dosya seçer
         return files
 
-    def get_files(self) -> list[str]:
+    def get_files(self) -> Iterator["Choice"]:
         """Konfigüre edilmiş klasördeki tüm dosyaları listeler.
         
-        Alt klasörlere bakmaz, sadece verilen path'teki dosyaları listeler.
+        config.recursive False ise sadece verilen path'teki dosyaları, True
+        ise alt klasörlerdekileri de listeler. Generator olarak çalışır;
+        seçenekler tarama sırasında tek tek üretilir ve araya liste kopyası
+        girmeden doğrudan prompt'a aktarılabilir.
         
-        Returns:
-            list[str]: Dosya isimleri listesi (sadece isimler, full path değil).
+        Yields:
+            Choice: InquirerPy seçeneği. name, config.path'e relative dosya
+                adıdır (recursive modda "alt/dosya.csv" biçiminde); value ise
+                DirEntry'nin tam yoludur, seçimden sonra path birleştirmeye
+                gerek kalmaz.
         
         Raises:
             SystemExit: Klasör boşsa veya okuma hatası oluşursa.
         
         Example:
             >>> cli = CLI(CLIConfig(path="./data"))
-            >>> files = cli.get_files()
+            >>> files = [choice.name for choice in cli.get_files()]
             >>> print(files)
             ['data.csv', 'employees.xlsx', 'products.json']
         
         Note:
             Sadece dosyaları listeler, alt klasörleri filtreleyerek atar.
+            Bulunan DirEntry nesneleri aynı geçişte tam yollarına göre
+            self._entries içinde saklanır ve visualize_files() tarafından
+            tekrar stat yapmadan kullanılır. En fazla config.max_file dosya
+            listelenir; limite ulaşıldığında tarama durdurulur, klasörün geri
+            kalanı okunmaz. Tamamlanan ilk taramanın sonucu cache'lenir;
+            sonraki çağrılar klasörü tekrar taramaz (path __post_init__
+            sonrası değişmez).
         """
-        try:
-            all_items = os.listdir(self.config.path)
-
-            # Filter only files (not directories)
-            files_list = [
-                item
-                for item in all_items
-                if os.path.isfile(os.path.join(self.config.path, item))
-            ]
-
-            if len(files_list) == 0:
-                sys.exit(
-                    f"An error occur: {self.config.path} {CLIError.FolderIsEmpty.value}"
-                )
+        if self._files_cache is not None:
+            yield from self._files_cache
+            return
 
-            return files_list
+        from InquirerPy.base.control import Choice
 
-        except Exception as e:
+        self._entries = {}
+        choices = []
+        try:
+            prefix_len = len(self.config._sep_path)
+            with closing(self._walk(self.config._resolved)) as entries:
+                for entry in entries:
+                    if len(self._entries) >= self.config.max_file:
+                        break
+                    self._entries[entry.path] = entry
+                    choice = Choice(value=entry.path, name=entry.path[prefix_len:])
+                    choices.append(choice)
+                    yield choice
+
+        except OSError as e:
             sys.exit(f"Error reading directory: {str(e)}")
 
+        if not self._entries:
+            sys.exit(
+                f"An error occur: {self.config.path} {CLIError.FolderIsEmpty.value}"
+            )
+
+        self._files_cache = choices
+
+    def _walk(self, root: str) -> Iterator[os.DirEntry]:
+        """Klasördeki dosyaları os.scandir ile dolaşır.
+        
+        Tamamen string path'ler üzerinde çalışır, hiçbir giriş için Path
+        nesnesi oluşturulmaz. Recursive modda alt klasörler bir stack ile
+        (özyineleme olmadan) taranır. Sembolik link dosyalar listelenir; sembolik
+        link klasörler takip edilmez, böylece döngüsel linkler sonsuz taramaya
+        yol açmaz.
+        
+        Args:
+            root (str): Taramanın başlayacağı mutlak klasör yolu.
+        
+        Yields:
+            os.DirEntry: Bulunan her dosyanın girişi.
+        
+        Raises:
+            OSError: Kök klasör okunamazsa. Okunamayan alt klasörler atlanır.
+        
+        Note:
+            is_file()/is_dir() kontrolleri d_type bilgisini kullanır,
+            giriş başına ek stat çağrısı yapılmaz (sadece sembolik linkler
+            için hedef stat'lanır).
+        """
+        stack = [root]
+        while stack:
+            top = stack.pop()
+            try:
+                entries = os.scandir(top)
+            except OSError:
+                if top is root:
+                    raise
+                continue  # Okunamayan alt klasör atlanır, tarama devam eder
+
+            with entries:
+                for entry in entries:
+                    if entry.is_file():
+                        yield entry
+                    elif self.config.recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+
     def intro(self):
         """ASCII banner ve uygulama bilgilerini konsola yazdırır.
         
@@ -243,44 +347,40 @@ class CLI(CLIConfig):
         Note:
             Bu method sadece yazdırma yapar, herhangi bir işlem yapmaz.
         """
-        banner = r"""
-           ╦  ╦╦╔═╗╦ ╦╔═╗╦  ╦╔═╗╔═╗
-           ╚╗╔╝║╚═╗║ ║╠═╣║  ║╔═╝║╣
-            ╚╝ ╩╚═╝╚═╝╩ ╩╩═╝╩╚═╝╚═╝
-                   """
-
-        subtitle = "Visualize is a toolchain for data visualization"
-        separator = "=" * 50
-        github_info = f"GitHub: {self.project_link}"
-        actions = (
-            "\tFor selection press [Space]\n"
-            + "\tFor move press [Up] or [Down]\n"
-            + "\tFor answer press [Enter]\n"
-            + "\tFor exit press [q]\n"
+        body = _INTRO_BODY_TEMPLATE.format(
+            github_info=f"GitHub: {self.project_link}", path=self.config.path
         )
-        print("\n" + banner)
-        print(f"{subtitle:^50}")
-        print(separator)
-        print(f"{github_info:^50}")
-        print(separator + "\n")
-        print(f"📁 Scanning directory: {self.config.path}")
-        print(f"Actions:\n{actions:^50}")
-
-    def visualize_files(self, file_names: list[str]):
+
+        stream = sys.stdout
+        buffer = getattr(stream, "buffer", None)
+        encoding = (getattr(stream, "encoding", None) or "").lower()
+        if buffer is None or encoding not in ("utf-8", "utf8"):
+            # Binary buffer yoksa (örn. StringIO) veya terminal UTF-8 değilse
+            stream.write(_INTRO_HEAD + body + _INTRO_TAIL)
+            return
+
+        # Text katmanında bekleyen çıktı, sıralama bozulmasın diye önce yazılır
+        stream.flush()
+        buffer.write(_INTRO_HEAD_BYTES)
+        buffer.write(body.encode("utf-8"))
+        buffer.write(_INTRO_TAIL_BYTES)
+        buffer.flush()
+
+    def visualize_files(self, file_paths: list[str]):
         """Seçilen dosyalar için görselleştirme workflow'unu başlatır.
         
-        Dosya isimlerini full path'e çevirir, validate eder ve geçerli
-        olanlar için VisualizationWorkflow'u başlatır.
+        Dosyaları validate eder ve geçerli olanlar için
+        VisualizationWorkflow'u başlatır.
         
         Args:
-            file_names (list[str]): Kullanıcının seçtiği dosya isimleri
-                (config.path'e relative).
+            file_paths (list[str]): Kullanıcının seçtiği dosyaların tam
+                yolları (create_files_prompt() çıktısı).
         
         Raises:
             SystemExit: Hiçbir geçerli dosya yoksa.
         
         Example:
-            >>> cli.visualize_files(['data.csv', 'employees.xlsx'])
+            >>> cli.visualize_files(cli.create_files_prompt())
             ✅ 2 valid file(s) ready for visualization
             🚀 Starting visualization...
         
@@ -291,23 +391,33 @@ class CLI(CLIConfig):
         Todo:
             Tüm mantık burada, daha modüler hale getirilmeli.
         """
-        full_paths = [
-            os.path.join(self.config.path, file_name) for file_name in file_names
-        ]
+        # 1. aşama: saf string kontrolü, dosya sistemine erişilmez ve exception yok
+        candidates = []
+        for file_path in file_paths:
+            if File.has_valid_suffix(file_path):
+                candidates.append(file_path)
+            else:
+                print(
+                    f"⚠️  Skipping {self._display_name(file_path)}: "
+                    f"{CLIError.FileIsNotValid.value}"
+                )
 
+        # 2. aşama: I/O sadece uzantısı geçerli dosyalar için yapılır
         valid_files = []
-        for file_path in full_paths:
+        stat_results = {}
+        for file_path in candidates:
+            entry = self._entries.get(file_path)
             try:
-                file = File(file_path)
-                file.__post_init__()  
-                if file.validate_suffix():
-                    valid_files.append(file_path)
+                if entry is not None:
+                    # scandir'den gelen giriş zaten doğrulandı, stat cache'lenmiş
+                    # Sembolik linkte hedef dosyanın stat'ı alınır
+                    stat_results[file_path] = entry.stat()
                 else:
-                    print(
-                        f"⚠️  Skipping {Path(file_path).name}: {CLIError.FileIsNotValid}"
-                    )
-            except Exception as e:
-                print(f"⚠️  Skipping {Path(file_path).name}: {str(e)}")
+                    File(file_path)  # Oluşturulurken validate edilir
+            except (OSError, FileValidationError) as e:
+                print(f"⚠️  Skipping {self._display_name(file_path)}: {str(e)}")
+                continue
+            valid_files.append(file_path)
 
         if not valid_files:
             sys.exit(f"{CLIError.FolderDoesntHaveValidFileTypes.value}")
@@ -315,8 +425,24 @@ class CLI(CLIConfig):
 
         print(f"\n✅ {len(valid_files)} valid file(s) ready for visualization")
 
+        # matplotlib/pandas yüklemesi dosya seçimi sonrasına ertelenir
+        from .visualize import VisualizationWorkflow
+
         workflow = VisualizationWorkflow()
-        workflow.run_with_shared_config(valid_files)
+        workflow.run_with_shared_config(valid_files, stat_results)
+
+    def _display_name(self, file_path: str) -> str:
+        """Tam dosya yolunu kullanıcıya gösterilecek relative isme çevirir.
+        
+        Args:
+            file_path (str): Dosyanın tam yolu.
+        
+        Returns:
+            str: config.path'e relative isim; path dışındaysa yolun kendisi.
+        """
+        if file_path.startswith(self.config._sep_path):
+            return file_path[len(self.config._sep_path):]
+        return file_path
 
     def run(self):
         """CLI uygulamasını çalıştırır (ana entry point).
@@ -343,10 +469,11 @@ class CLI(CLIConfig):
         selected_files = self.create_files_prompt()
 
         if selected_files:
-            print(f"\n✅ Selected {len(selected_files)} file(s):")
-            for f in selected_files:
-                print(f"   📄 {f}")
-            print("\n🚀 Starting visualization...\n")
+            sys.stdout.write(
+                f"\n✅ Selected {len(selected_files)} file(s):\n"
+                + "".join(f"   📄 {self._display_name(f)}\n" for f in selected_files)
+                + "\n🚀 Starting visualization...\n\n"
+            )
 
             # Start visualization
             self.visualize_files(selected_files)
@@ -6,20 +6,27 @@ okunması, validasyonu ve metadata çıkarımı için gerekli sınıfları içer
 Pandas kütüphanesi kullanılarak dosyalar D ataFrame'e dönüştürülür ve
 görselleştirme için hazır hale getirilir.
 
+Attributes:
+    VALID_EXTS: Desteklenen uzantıların tuple hali.
+    VALID_EXT_SET: Desteklenen uzantıların frozenset hali.
+    CACHE_SUFFIX: CSV/TXT dosyaları için yazılan Parquet cache'inin eki.
+
 Classes:
     FileExtension: Desteklenen dosya uzantıları enum'u.
     FileError: Dosya işlemi hataları enum'u.
+    FileValidationError: Dosya validasyonu başarısız olduğunda fırlatılır.
+    FileReadError: Dosya okunamadığında fırlatılır.
+    FileMetadata: Dosyanın adı, uzantısı ve boyutu.
     File: Dosya nesnesi ve validasyon işlemleri.
     FileHandler: Dosya okuma ve veri işleme operasyonları.
 
 Example:
     Temel kullanım::
 
-        from file import File, FileHandler
+        from visualize.file import File, FileHandler
         
-        # Dosya oluştur ve validate et
+        # Dosya oluştur (validasyon otomatik yapılır)
         file = File("/path/to/data.csv")
-        file.__post_init__()
         
         # Dosyayı oku
         handler = FileHandler(file)
@@ -29,18 +36,43 @@ Example:
         handler.preview_data(rows=10)
 """
 
-import sys
+import csv
+import hashlib
+import os
+import stat
+from collections.abc import Callable
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
+from typing import Literal
 
 import pandas as pd
 
-
-class FileExtension(Enum):
+# pyarrow opsiyoneldir: pandas'ın çok çekirdekli Arrow CSV parser'ını ve
+# Arrow tabanlı (daha az bellek kullanan) dtype'ları etkinleştirir.
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Polars opsiyoneldir: çok çekirdekli Rust parser ile CSV/TXT okumayı
+# hızlandırır. pandas'a dönüşüm (to_pandas) pyarrow gerektirir; ikisinden
+# biri yoksa okuma pandas ile yapılır.
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+if pyarrow is None:
+    pl = None
+
+
+class FileExtension(str, Enum):
     """Veri analizi için desteklenen dosya uzantıları.
     
     Bu enum, Visualize uygulamasının desteklediği tüm dosya formatlarını
-    tanımlar. Her format için dosya uzantısı string olarak saklanır.
+    tanımlar. str mixin'i sayesinde üyeler doğrudan uzantı string'leriyle
+    karşılaştırılabilir (FileExtension.CSV == ".csv"); .value gerekmez.
     
     Attributes:
         CSV (str): Virgülle ayrılmış değerler (.csv).
@@ -62,6 +94,98 @@ class FileExtension(Enum):
     TXT = ".txt"
 
 
+VALID_EXTS: tuple[str, ...] = tuple(ext.value for ext in FileExtension)
+"""Desteklenen uzantılar, import anında FileExtension'dan düz string olarak alınır."""
+
+VALID_EXT_SET: frozenset[str] = frozenset(VALID_EXTS)
+"""VALID_EXTS'in O(1) üyelik kontrolü için frozenset hali."""
+
+
+_POLARS_EXTENSIONS: frozenset[str] = frozenset(
+    {FileExtension.CSV, FileExtension.TXT}
+)
+"""Polars engine ile okunabilen uzantılar. JSON her zaman pandas ile okunur:
+pl.read_json, pandas'ın varsayılan "columns" yönelimli çıktısını
+(DataFrame.to_json()) tek satırlık sözlük hücrelerine çevirir."""
+
+_EXCEL_EXTENSIONS: frozenset[str] = frozenset(
+    {FileExtension.EXCEL, FileExtension.EXCEL_OLD}
+)
+"""calamine engine ile okunan Excel uzantıları."""
+
+_LAZY_EXTENSIONS: frozenset[str] = frozenset(
+    {FileExtension.CSV, FileExtension.TXT}
+)
+"""Polars LazyFrame (scan_csv) ile tembel açılabilen uzantılar."""
+
+_POLARS_NULL_VALUES: tuple[str, ...] = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+)
+"""pandas.read_csv'in varsayılan eksik değer işaretleri. Polars bunları
+kendiliğinden null saymaz; verilmezse "NA" içeren sayısal kolon metne döner."""
+
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+"""Bu boyuttan büyük CSV/TXT dosyaları pandas'a memory-map ile verilir."""
+
+CACHE_SUFFIX = ".cache.parquet"
+"""Parquet cache dosyasının eki; data.csv için data.csv-<hash>.cache.parquet."""
+
+_CACHE_SOURCE_KEY = b"visualize.source"
+"""Parquet cache metadata'sında kaynak dosyanın "boyut:mtime_ns" imzasının
+tutulduğu anahtar."""
+
+_PREVIEW_MAX_COLUMNS = 20
+_PREVIEW_WIDTH = 120
+
+_SNIFF_BYTES = 64 * 1024
+_SNIFF_DELIMITERS = ",;\t|"
+
+
+def _cache_dir() -> Path:
+    """Parquet cache'lerinin yazıldığı kullanıcı cache klasörünü döndürür.
+    
+    XDG_CACHE_HOME tanımlıysa onun altındaki, değilse ~/.cache altındaki
+    visualize klasörüdür.
+    
+    Returns:
+        Path: Cache klasörü (henüz oluşturulmamış olabilir).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "visualize"
+
+
+def _sniff_sep(path: Path) -> str:
+    """Dosyanın ilk 64 KB'ından delimiter'ı tahmin eder.
+    
+    Örnek csv.Sniffer ile aday delimiter'lar (virgül, noktalı virgül, tab,
+    dikey çizgi) arasından çözümlenir. Böylece dosyanın tamamı python
+    engine ile okunmak yerine hızlı C/Arrow parser'a açık sep verilebilir.
+    Tespit edilemezse virgül döner.
+    
+    Args:
+        path (Path): Metin dosyasının yolu.
+    
+    Returns:
+        str: Tahmin edilen delimiter.
+    """
+    with open(path, "rb") as f:
+        sample = f.read(_SNIFF_BYTES).decode("utf-8", "replace")
+
+    # Yarım kalan son satır Sniffer'ı yanıltmasın
+    cut = sample.rfind("\n")
+    if cut > 0:
+        sample = sample[:cut]
+
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=_SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+
 class FileError(Enum):
     """Dosya işlemleri sırasında oluşabilecek hata mesajları.
     
@@ -79,116 +203,226 @@ class FileError(Enum):
     PermissonDenied = "Permission denied"
 
 
+class FileValidationError(Exception):
+    """Dosya bulunamadığında, dosya olmadığında veya erişilemediğinde fırlatılır."""
+
+
+class FileReadError(Exception):
+    """Dosya içeriği okunamadığında veya format desteklenmediğinde fırlatılır."""
+
+
+@dataclass(frozen=True)
+class FileMetadata:
+    """Dosyanın metadata bilgileri.
+    
+    Ad, uzantı ve byte cinsinden boyut oluşturulurken alınır; KB/MB
+    boyutları sadece ilk erişimde hesaplanır.
+    
+    Attributes:
+        name (str): Dosyanın tam adı (uzantı ile birlikte).
+        stem (str): Dosya adı (uzantısız).
+        extension (str): Dosya uzantısı (örn: '.csv').
+        size_bytes (int): Dosya boyutu byte cinsinden.
+    """
+
+    name: str
+    stem: str
+    extension: str
+    size_bytes: int
+
+    @cached_property
+    def size_kb(self) -> float:
+        """Dosya boyutu KB cinsinden (2 basamak)."""
+        return round(self.size_bytes / 1024, 2)
+
+    @cached_property
+    def size_mb(self) -> float:
+        """Dosya boyutu MB cinsinden (2 basamak)."""
+        return round(self.size_bytes / (1024**2), 2)
+
+
+@dataclass(slots=True, eq=False)
 class File:
     """Dosya nesnesi ve validasyon işlemleri.
     
     Bu sınıf bir dosya path'ini alır, validate eder ve metadata bilgilerini
-    sağlar. Dosya işlemlerinden önce mutlaka __post_init__() çağrılmalıdır.
+    sağlar. Validasyon (__post_init__) nesne oluşturulurken otomatik yapılır.
     
     Attributes:
-        path (Path): Dosyanın Path objesi.
+        path (Path): Dosyanın Path objesi. str verilirse Path'e çevrilir.
+        stat_result (os.stat_result | None): Sadece init parametresi. Daha
+            önce alınmış stat sonucu (örn. os.scandir() girişinden); verilirse
+            validasyon dosya sistemine tekrar erişmez.
+        _stat (os.stat_result | None): Saklanan stat sonucu. Dosya başına
+            tek stat yapılır; get_stat(), get_metadata() ve __post_init__()
+            bu değeri paylaşır.
+        _meta (FileMetadata | None): Saklanan metadata; ilk get_metadata()
+            çağrısında oluşturulur.
+    
+    Eşitlik ve hash nesne kimliğine göredir (eq=False); File dict/set
+    anahtarı olarak kullanılabilir ve saklanan stat/metadata karşılaştırmayı
+    etkilemez.
     
     Example:
-        >>> file = File("/path/to/data.csv")
-        >>> file.__post_init__()  # Validate
+        >>> file = File("/path/to/data.csv")  # Validate
         >>> metadata = file.get_metadata()
-        >>> print(metadata['name'])
+        >>> print(metadata.name)
         'data.csv'
     """
 
-    def __init__(self, path: str):
-        """File sınıfını başlatır.
-        
-        Args:
-            path (str): Dosyanın tam yolu (absolute veya relative).
-        
-        Note:
-            Bu method sadece path'i saklar. Validasyon için mutlaka
-            __post_init__() çağrılmalıdır.
-        """
-        self.path = Path(path)
+    path: Path
+    stat_result: InitVar[os.stat_result | None] = None
+    _stat: os.stat_result | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _meta: FileMetadata | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def __post_init__(self):
+    def __post_init__(self, stat_result: os.stat_result | None = None):
         """Dosya validasyonu yapar.
         
+        Dataclass tarafından nesne oluşturulurken otomatik çağrılır.
         Dosyanın var olup olmadığını, bir dosya olup olmadığını (klasör değil)
-        ve erişim yetkisi olup olmadığını kontrol eder.
+        ve erişim yetkisi olup olmadığını kontrol eder. stat_result verildiyse
+        stat yapılmaz, sadece dosya tipi kontrol edilir.
+        
+        Args:
+            stat_result (os.stat_result | None, optional): Önceden alınmış
+                stat sonucu.
         
         Raises:
-            SystemExit: Dosya bulunamadığında, klasör olduğunda veya
-                erişim yetkisi olmadığında program sonlandırılır.
+            FileValidationError: Dosya bulunamadığında, klasör olduğunda veya
+                erişim yetkisi olmadığında.
         
         Example:
-            >>> file = File("data.csv")
-            >>> file.__post_init__()  # Hata yoksa devam, varsa sys.exit()
+            >>> try:
+            ...     file = File("data.csv")
+            ... except FileValidationError as e:
+            ...     print(e)
         
-        Warning:
-            Bu method doğrudan sys.exit() çağırır. Hata yakalama için
-            try-except kullanılması önerilmez, bunun yerine dosya yolunu
-            önceden kontrol edin.
+        Note:
+            Hata programı sonlandırmaz; birden çok dosya doğrulanırken hatalı
+            olanlar atlanabilir. Mesaj, CLI'ın doğrudan gösterebileceği
+            biçimdedir.
         """
-        try:
-            # Convert to Path object for better handling
-            path = self.get_path()
-
-            # Check if file exists
-            if not path.exists():
-                sys.exit(f"An Error occur: {FileError.FileDoesntExist.value}")
-
-            # Check if it's actually a file (not a directory)
-            if not path.is_file():
-                sys.exit(f"An Error occur: {FileError.NotFile.value}")
+        if not isinstance(self.path, Path):
+            self.path = Path(self.path)
+
+        if stat_result is None:
+            try:
+                # Tek stat çağrısı hem varlık hem dosya tipi kontrolünü karşılar
+                stat_result = self.path.stat()
+
+            except (FileNotFoundError, NotADirectoryError) as e:
+                raise FileValidationError(
+                    f"An Error occur: {FileError.FileDoesntExist.value}"
+                ) from e
+            except PermissionError as e:
+                raise FileValidationError(
+                    f"An Error occur: {FileError.PermissonDenied.value}"
+                ) from e
+            except Exception as e:
+                raise FileValidationError(f"Unexpected Error: {str(e)}") from e
+
+        # Check if it's actually a file (not a directory)
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise FileValidationError(f"An Error occur: {FileError.NotFile.value}")
+
+        self._stat = stat_result
+        self._meta = None
+
+    def get_stat(self) -> os.stat_result:
+        """Dosyanın stat sonucunu döndürür.
+        
+        Sonuç ilk çağrıda alınır ve saklanır; validasyon, metadata ve okuma
+        işlemleri aynı stat sonucunu paylaşır. Dosya stat_result ile (örn.
+        CLI'ın os.scandir() taramasından) oluşturulduysa veya __post_init__()
+        stat yaptıysa hiç ek stat yapılmaz.
+        
+        Returns:
+            os.stat_result: Dosyanın stat bilgisi.
+        
+        Example:
+            >>> file = File("data.csv")
+            >>> file.get_stat().st_size
+            12748
+        """
+        if self._stat is None:
+            self._stat = self.get_path().stat()
+        return self._stat
 
-        except PermissionError:
-            sys.exit(f"An Error occur: {FileError.PermissonDenied.value}")
-        except Exception as e:
-            sys.exit(f"Unexpected Error: {str(e)}")
+    def refresh(self):
+        """Saklanan stat sonucunu ve metadata'yı temizler.
+        
+        Dosya diskte değiştiyse bir sonraki get_stat()/get_metadata() çağrısı
+        güncel bilgiyi tekrar okur.
+        """
+        self._stat = None
+        self._meta = None
 
-    def get_metadata(self) -> dict[str, str | int | float]:
+    def get_metadata(self) -> FileMetadata:
         """Dosya metadata bilgilerini döndürür.
         
-        Dosyanın adı, uzantısı, boyutu gibi meta bilgileri çıkarır.
+        Dosyanın adı, uzantısı, boyutu gibi meta bilgileri çıkarır. Nesne
+        ilk çağrıda oluşturulur ve refresh() çağrılana kadar aynı nesne döner.
         
         Returns:
-            dict[str, str | int | float]: Metadata sözlüğü, aşağıdaki anahtarları içerir:
-                - name (str): Dosyanın tam adı (uzantı ile birlikte).
-                - stem (str): Dosya adı (uzantısız).
-                - extension (str): Dosya uzantısı (örn: '.csv').
-                - size_kb (float): Dosya boyutu KB cinsinden.
-                - size_mb (float): Dosya boyutu MB cinsinden.
+            FileMetadata: Ad, kök ad, uzantı ve boyut bilgileri.
         
         Example:
             >>> file = File("data.csv")
-            >>> file.__post_init__()
             >>> metadata = file.get_metadata()
-            >>> print(f"File: {metadata['name']}, Size: {metadata['size_kb']} KB")
+            >>> print(f"File: {metadata.name}, Size: {metadata.size_kb} KB")
             File: data.csv, Size: 12.45 KB
         """
-        path = self.get_path()
-
-        stat = path.stat()
-
-        metadata = {
-            "name": path.name,  # Full filename
-            "stem": path.stem,  # Filename without extension
-            "extension": path.suffix,  # Extension (e.g., .txt)
-            "size_kb": round(stat.st_size / 1024, 2),
-            "size_mb": round(stat.st_size / (1024**2), 2),
-        }
-
-        return metadata
+        if self._meta is None:
+            path = self.get_path()
+            self._meta = FileMetadata(
+                name=path.name,
+                stem=path.stem,
+                extension=path.suffix,
+                size_bytes=self.get_stat().st_size,
+            )
+        return self._meta
+
+    @property
+    def metadata(self) -> FileMetadata:
+        """get_metadata() için kısa erişim; cache'lenmiş metadata'yı döndürür."""
+        return self.get_metadata()
+
+    @staticmethod
+    def has_valid_suffix(name: str) -> bool:
+        """Dosya adının desteklenen bir uzantıyla bitip bitmediğini kontrol eder.
+        
+        Path nesnesi oluşturmadan, sadece string üzerinde çalışır. Seçilen
+        dosyaları I/O yapmadan ön elemeden geçirmek için kullanılır.
+        
+        Args:
+            name (str): Dosya adı veya yolu.
+        
+        Returns:
+            bool: Uzantı destekleniyorsa True, değilse False.
+        
+        Example:
+            >>> File.has_valid_suffix("data.csv")
+            True
+            >>> File.has_valid_suffix("notes.md")
+            False
+        """
+        return os.path.splitext(name)[1] in VALID_EXT_SET
 
     def validate_suffix(self) -> bool:
         """Dosya uzantısının desteklenen formatlardan biri olup olmadığını kontrol eder.
         
-        FileExtension enum'undaki uzantılarla karşılaştırma yapar.
+        Path'in zaten ayrıştırılmış suffix'i önceden hesaplanmış
+        VALID_EXT_SET'te aranır; dosya sistemine erişilmez.
         
         Returns:
             bool: Uzantı destekleniyorsa True, değilse False.
         
         Example:
             >>> file = File("data.csv")
-            >>> file.__post_init__()
             >>> if file.validate_suffix():
             ...     print("Supported format")
             Supported format
@@ -196,13 +430,7 @@ class File:
         See Also:
             FileExtension: Desteklenen uzantılar listesi.
         """
-        metadata = self.get_metadata()
-        extension = metadata.get("extension")
-
-        if extension not in {ext.value for ext in FileExtension}:
-            return False
-
-        return True
+        return self.path.suffix in VALID_EXT_SET
 
     def get_path(self) -> Path:
         """Dosyanın Path objesini döndürür.
@@ -228,84 +456,482 @@ class FileHandler:
     Attributes:
         file (File): İşlenecek dosya nesnesi.
         data (pd.DataFrame | None): Okunan veri DataFrame'i. İlk okumadan önce None.
+        engine (str): Okuma motoru, "polars" veya "pandas". Polars yüklü
+            değilse otomatik olarak "pandas" kullanılır.
     
     Example:
         >>> file = File("employees.xlsx")
-        >>> file.__post_init__()
         >>> handler = FileHandler(file)
         >>> data = handler.read_file()
         >>> handler.preview_data(rows=5)
     """
 
-    def __init__(self, file: File):
+    def __init__(
+        self,
+        file: File,
+        engine: Literal["pandas", "polars"] = "polars",
+        use_cache: bool = True,
+    ):
         """FileHandler sınıfını başlatır.
         
         Args:
             file (File): Validate edilmiş File nesnesi.
+            engine (Literal["pandas", "polars"], optional): Okuma motoru.
+                Varsayılan "polars"; polars/pyarrow yüklü değilse "pandas".
+            use_cache (bool, optional): CSV/TXT dosyaları ilk okumada
+                kullanıcı cache klasörüne (_cache_dir()) Parquet olarak
+                kaydedilsin ve sonraki çalıştırmalarda oradan okunsun mu.
+                Varsayılan True; pyarrow yüklü değilse kapalıdır.
         
         Note:
-            File nesnesi üzerinde __post_init__() çağrılmış olmalıdır.
+            File nesnesi oluşturulurken validate edilmiş olur.
         """
         self.file = file
+        self.use_cache = use_cache and pyarrow is not None
         self.data: pd.DataFrame | None = None
+        self.lazy: "pl.LazyFrame | None" = None
+        self._xlsx: pd.ExcelFile | None = None
+        self.engine = engine if pl is not None else "pandas"
+
+    def scan_file(self) -> None:
+        """Dosyayı okumadan tembel (lazy) olarak açar.
+        
+        engine "polars" ise CSV ve TXT dosyaları pl.scan_csv ile açılır;
+        I/O, veri ilk kez gerektiğinde (get_data) yapılır. Kolon isimleri
+        ve önizleme dosyanın tamamı okunmadan elde edilir. Diğer durumlarda
+        read_file() ile dosya hemen okunur. Dosya zaten açılmış veya
+        okunmuşsa hiçbir şey yapılmaz.
+        
+        Raises:
+            FileReadError: Dosya açılamadığında.
+        
+        Example:
+            >>> handler = FileHandler(file)
+            >>> handler.scan_file()
+            >>> handler.get_column_names()  # Sadece şema okunur
+            ['Name', 'Age', 'City', 'Salary']
+        """
+        if self.data is not None or self.lazy is not None:
+            return
 
-    def read_file(self) -> pd.DataFrame:
+        extension = self.file.metadata.extension
+
+        if self.engine != "polars" or extension not in _LAZY_EXTENSIONS:
+            self.read_file()
+            return
+
+        try:
+            cache = self._fresh_cache()
+            if cache is not None:
+                self.lazy = pl.scan_parquet(cache)
+            else:
+                self.lazy = self._scan_with_polars(self.file.get_path(), extension)
+        except Exception as e:
+            raise FileReadError(f"❌ Error reading file: {str(e)}") from e
+
+    def materialize(self) -> pd.DataFrame:
+        """Tembel açılmış dosyayı okuyup pandas DataFrame'e dönüştürür.
+        
+        Polars'ın streaming engine'i ile toplanır. Dosya tembel açılmamışsa
+        read_file() çağrılır.
+        
+        Returns:
+            pd.DataFrame: Okunan veri DataFrame'i.
+        
+        Raises:
+            FileReadError: Dosya okunamadığında.
+        """
+        if self.lazy is None:
+            return self.read_file()
+
+        try:
+            self.data = self.lazy.collect(engine="streaming").to_pandas()
+        except Exception as e:
+            raise FileReadError(f"❌ Error reading file: {str(e)}") from e
+
+        self._write_cache(self.data)
+        return self.data
+
+    def read_file(self, nrows: int | None = None) -> pd.DataFrame:
         """Dosyayı uzantısına göre okur ve DataFrame'e dönüştürür.
         
         Dosya uzantısını tespit eder ve uygun pandas okuyucusunu kullanır:
         - CSV: pd.read_csv()
-        - Excel: pd.read_excel()
+        - Excel: cache'lenmiş pd.ExcelFile (calamine) ile ilk sayfa
         - JSON: pd.read_json()
-        - TXT: pd.read_csv() ile otomatik delimiter tespiti
+        - TXT: örnekten tespit edilen delimiter ile pd.read_csv()
+        
+        engine "polars" ise CSV ve TXT dosyaları Polars'ın çok çekirdekli
+        parser'ı ile okunur ve görselleştirme katmanı pandas beklediği için
+        pandas DataFrame'e dönüştürülür. Excel ve JSON her zaman pandas ile
+        okunur.
+        
+        Args:
+            nrows (int | None, optional): Sadece ilk N satırı oku. Okuyucu
+                N satırdan sonra durur (JSON hariç, o okunup kesilir).
+                Varsayılan None (tüm dosya).
         
         Returns:
             pd.DataFrame: Okunan veri DataFrame'i.
         
         Raises:
-            SystemExit: Dosya okunamadığında veya desteklenmeyen format olduğunda.
+            FileReadError: Dosya okunamadığında veya desteklenmeyen format olduğunda.
         
         Example:
             >>> handler = FileHandler(file)
             >>> df = handler.read_file()
             >>> print(df.shape)
             (100, 5)
+            >>> handler.read_file(nrows=3).shape
+            (3, 5)
         
         Note:
-            Bu method self.data'yı günceller, sonraki çağrılarda
-            get_data() kullanılabilir.
+            Tüm dosya okunduğunda self.data güncellenir, sonraki çağrılarda
+            get_data() kullanılabilir. nrows ile yapılan kısmi okuma
+            self.data'ya yazılmaz.
         
         Warning:
-            Excel dosyaları için openpyxl kütüphanesi yüklü olmalıdır:
-            pip install openpyxl
+            Excel dosyaları için python-calamine kütüphanesi yüklü olmalıdır:
+            pip install python-calamine
         """
-        extension = self.file.get_metadata()["extension"]
+        extension = self.file.metadata.extension
         path = self.file.get_path()
 
         try:
-            if extension == FileExtension.CSV.value:
-                self.data = pd.read_csv(path)
-            elif extension in [
-                FileExtension.EXCEL.value,
-                FileExtension.EXCEL_OLD.value,
-            ]:
-                self.data = pd.read_excel(path)
-            elif extension == FileExtension.JSON.value:
-                self.data = pd.read_json(path)
-            elif extension == FileExtension.TXT.value:
-                # Otomatik delimiter tespiti için sep=None ve python engine
-                self.data = pd.read_csv(path, sep=None, engine="python")
+            cache = self._fresh_cache() if nrows is None else None
+
+            if cache is not None and self.engine == "polars":
+                data = pl.read_parquet(cache).to_pandas()
+            elif cache is not None:
+                data = pd.read_parquet(cache, dtype_backend="pyarrow")
+            elif self.engine == "polars" and extension in _POLARS_EXTENSIONS:
+                data = self._read_with_polars(path, extension, nrows)
             else:
-                raise ValueError(f"Unsupported file type: {extension}")
+                reader = self._READERS.get(extension)
+                if reader is None:
+                    raise ValueError(f"Unsupported file type: {extension}")
+                data = reader(self, path, nrows)
+
+            if nrows is None:
+                self.data = data
+                if cache is None:
+                    self._write_cache(data)
+            return data
+
+        except Exception as e:
+            raise FileReadError(f"❌ Error reading file: {str(e)}") from e
+
+    def read_columns_only(self) -> list[str]:
+        """Dosyanın sadece kolon isimlerini okur.
+        
+        Veri okunmaz: güncel Parquet cache'i varsa şemasından, yoksa dosyanın
+        başlık satırından (nrows=0) alınır. JSON dosyaları başlık satırı
+        olmadığı için tamamen okunur; okunan veri self.data'da tutulur ve
+        read_columns() dosyayı tekrar parse etmez.
+        
+        Returns:
+            list[str]: Kolon isimleri.
+        
+        Raises:
+            FileReadError: Dosya okunamadığında.
+        
+        Example:
+            >>> FileHandler(File("data.csv")).read_columns_only()
+            ['Month', 'Sales']
+        """
+        if self.data is not None:
+            return self.data.columns.tolist()
+
+        cache = self._fresh_cache()
+        if cache is not None:
+            import pyarrow.parquet
+
+            try:
+                return pyarrow.parquet.ParquetFile(cache).schema_arrow.names
+            except Exception as e:
+                raise FileReadError(f"❌ Error reading file: {str(e)}") from e
+
+        if self.file.metadata.extension == FileExtension.JSON:
+            return self.read_file().columns.tolist()
+        return self.read_file(nrows=0).columns.tolist()
+
+    def read_columns(self, columns: list[str]) -> pd.DataFrame:
+        """Dosyadan sadece verilen kolonları okur.
+        
+        Diğer kolonlar parse edilmez ve belleğe alınmaz. Kısmi okuma
+        olduğu için self.data güncellenmez.
+        
+        Args:
+            columns (list[str]): Okunacak kolon isimleri.
+        
+        Returns:
+            pd.DataFrame: Sadece istenen kolonları içeren veri.
+        
+        Raises:
+            FileReadError: Dosya okunamadığında veya kolon bulunamadığında.
+        
+        Example:
+            >>> handler.read_columns(["Month", "Sales"]).shape
+            (12, 2)
+        """
+        columns = list(dict.fromkeys(columns))
+        extension = self.file.metadata.extension
+        path = self.file.get_path()
+
+        try:
+            if self.data is not None:
+                return self.data[columns]
+
+            cache = self._fresh_cache()
+            if cache is not None and self.engine == "polars":
+                return pl.read_parquet(cache, columns=columns).to_pandas()
+            if cache is not None:
+                return pd.read_parquet(cache, columns=columns, dtype_backend="pyarrow")
+
+            if extension in _LAZY_EXTENSIONS:
+                if self.engine == "polars":
+                    lazy = self._scan_with_polars(path, extension).select(columns)
+                    return lazy.collect(engine="streaming").to_pandas()
+                sep = "," if extension == FileExtension.CSV else _sniff_sep(path)
+                return self._read_csv_with_pandas(path, sep, usecols=columns)
+
+            if extension in _EXCEL_EXTENSIONS:
+                workbook = self._workbook()
+                return workbook.parse(workbook.sheet_names[0], usecols=columns)
+
+            return self.read_file()[columns]
+
+        except FileReadError:
+            raise
+        except Exception as e:
+            raise FileReadError(f"❌ Error reading file: {str(e)}") from e
+
+    def close(self):
+        """Dosyaya bağlı açık kaynakları serbest bırakır.
+        
+        Cache'lenmiş Excel workbook'unu kapatır. Okunmuş veri (self.data) ve
+        tembel sorgu planı korunur; workbook tekrar gerekirse yeniden açılır.
+        
+        Example:
+            >>> handler.read_file()
+            >>> handler.close()
+        """
+        if self._xlsx is not None:
+            self._xlsx.close()
+            self._xlsx = None
+
+    def _workbook(self) -> pd.ExcelFile:
+        """Excel workbook'unu bir kez açar ve cache'ler.
+        
+        Returns:
+            pd.ExcelFile: calamine engine ile açılmış workbook.
+        """
+        if self._xlsx is None:
+            # calamine .xls ve .xlsx'i içerikten ayırt eder, tek yol yeterli
+            self._xlsx = pd.ExcelFile(self.file.get_path(), engine="calamine")
+        return self._xlsx
+
+    def _cache_path(self) -> Path:
+        """Dosyanın Parquet cache yolunu döndürür.
+        
+        Cache kullanıcının veri klasörüne değil _cache_dir()'e yazılır. Aynı
+        isimli farklı dosyalar karışmasın diye isme mutlak yolun hash'i
+        eklenir (örn. data.csv-1a2b3c4d5e6f7a8b.cache.parquet).
+        """
+        path = self.file.get_path()
+        digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:16]
+        return _cache_dir() / f"{path.name}-{digest}{CACHE_SUFFIX}"
+
+    def _source_signature(self) -> bytes:
+        """Kaynak dosyanın cache'e yazılan boyut ve mtime imzasını döndürür.
+        
+        Stat her çağrıda yeniden alınır; File'da saklanan stat CLI taramasından
+        kalmış olabilir.
+        """
+        st = os.stat(self.file.get_path())
+        return f"{st.st_size}:{st.st_mtime_ns}".encode()
+
+    def _fresh_cache(self) -> Path | None:
+        """Kaynak dosyayla eşleşen Parquet cache'i varsa yolunu döndürür.
+        
+        Cache, yazıldığı andaki kaynak boyutu ve mtime'ını (nanosaniye)
+        Parquet metadata'sında taşır; ikisi de birebir eşleşmelidir. Sadece
+        "cache kaynaktan yeni" kontrolü, kaynak daha eski mtime'lı bir
+        dosyayla değiştirildiğinde (git checkout, cp -p, rsync -t) eski
+        veriyi döndürürdü.
+        
+        Returns:
+            Path | None: Güncel cache yolu; cache kapalıysa, dosya CSV/TXT
+                değilse veya cache eski/yoksa None.
+        """
+        if not self.use_cache:
+            return None
+        if self.file.metadata.extension not in _LAZY_EXTENSIONS:
+            return None
 
-            return self.data
+        import pyarrow.parquet
 
+        cache = self._cache_path()
+        try:
+            metadata = pyarrow.parquet.read_metadata(cache).metadata or {}
+            signature = self._source_signature()
+        except Exception:
+            return None
+        return cache if metadata.get(_CACHE_SOURCE_KEY) == signature else None
+
+    def _write_cache(self, data: pd.DataFrame):
+        """CSV/TXT verisini cache klasörüne Parquet (zstd) olarak kaydeder.
+        
+        Cache sadece hızlandırma amaçlıdır; yazılamazsa (salt okunur klasör,
+        Parquet'e dönüştürülemeyen kolon vb.) uyarı yazdırılır ve okuma
+        etkilenmez. Dosya önce geçici isimle yazılıp yerine taşınır, böylece
+        yarım kalan bir yazma cache olarak okunmaz.
+        
+        Args:
+            data (pd.DataFrame): Tamamı okunmuş veri.
+        """
+        if not self.use_cache:
+            return
+        if self.file.metadata.extension not in _LAZY_EXTENSIONS:
+            return
+        if self._fresh_cache() is not None:
+            return
+
+        import pyarrow.parquet
+
+        cache = self._cache_path()
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        try:
+            table = pyarrow.Table.from_pandas(data)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), _CACHE_SOURCE_KEY: self._source_signature()}
+            )
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            pyarrow.parquet.write_table(table, tmp, compression="zstd")
+            os.replace(tmp, cache)
         except Exception as e:
-            sys.exit(f"❌ Error reading file: {str(e)}")
+            print(f"⚠️  Could not write cache for {self.file.metadata.name}: {str(e)}")
+            tmp.unlink(missing_ok=True)
+
+    def _read_csv(self, path: Path, nrows: int | None) -> pd.DataFrame:
+        """CSV dosyasını pandas ile okur."""
+        return self._read_csv_with_pandas(path, ",", nrows)
+
+    def _read_txt(self, path: Path, nrows: int | None) -> pd.DataFrame:
+        """TXT dosyasını örnekten tespit edilen delimiter ile pandas ile okur."""
+        return self._read_csv_with_pandas(path, _sniff_sep(path), nrows)
+
+    def _read_excel(self, path: Path, nrows: int | None) -> pd.DataFrame:
+        """Excel dosyasının ilk sayfasını cache'lenmiş workbook'tan okur."""
+        workbook = self._workbook()
+        return workbook.parse(workbook.sheet_names[0], nrows=nrows)
+
+    def _read_json(self, path: Path, nrows: int | None) -> pd.DataFrame:
+        """JSON dosyasını pandas ile okur; nrows desteklenmediği için keser."""
+        data = pd.read_json(path)
+        return data if nrows is None else data.head(nrows)
+
+    _READERS: dict[str, Callable[["FileHandler", Path, int | None], pd.DataFrame]] = {
+        FileExtension.CSV: _read_csv,
+        FileExtension.EXCEL: _read_excel,
+        FileExtension.EXCEL_OLD: _read_excel,
+        FileExtension.JSON: _read_json,
+        FileExtension.TXT: _read_txt,
+    }
+    """Uzantıdan pandas okuyucusuna dispatch tablosu."""
+
+    def _read_csv_with_pandas(
+        self,
+        path: Path,
+        sep: str,
+        nrows: int | None = None,
+        usecols: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """CSV veya TXT dosyasını pandas ile okur.
+        
+        pyarrow yüklüyse çok çekirdekli Arrow parser ve Arrow dtype'ları
+        kullanılır. Arrow parser nrows ve memory_map desteklemediği için
+        kısmi okumalarda ve pyarrow yokken C engine kullanılır. Arrow parser
+        tekrarlanan başlıkları yeniden adlandırmaz (a, a yerine a, a.1);
+        başlıkta tekrar varsa dosya C engine ile yeniden okunur.
+        
+        Args:
+            path (Path): Dosya yolu.
+            sep (str): Delimiter.
+            nrows (int | None, optional): Okunacak satır sayısı.
+            usecols (list[str] | None, optional): Sadece bu kolonları oku.
+        
+        Returns:
+            pd.DataFrame: Okunan veri.
+        """
+        if pyarrow is not None and nrows is None:
+            data = pd.read_csv(
+                path, sep=sep, usecols=usecols, engine="pyarrow", dtype_backend="pyarrow"
+            )
+            if not data.columns.has_duplicates:
+                return data
+
+        options = {"dtype_backend": "pyarrow"} if pyarrow is not None else {}
+        # Büyük dosyalarda buffer'lı read() kopyaları yerine mmap kullanılır
+        memory_map = self.file.get_stat().st_size >= _MMAP_THRESHOLD
+        return pd.read_csv(
+            path, sep=sep, nrows=nrows, usecols=usecols, memory_map=memory_map, **options
+        )
+
+    def _read_with_polars(
+        self, path: Path, extension: str, nrows: int | None = None
+    ) -> pd.DataFrame:
+        """CSV veya TXT dosyasını Polars ile okur.
+        
+        Args:
+            path (Path): Dosya yolu.
+            extension (str): Dosya uzantısı.
+            nrows (int | None, optional): Okunacak satır sayısı.
+        
+        Returns:
+            pd.DataFrame: pandas'a dönüştürülmüş veri.
+        
+        Raises:
+            ValueError: Uzantı Polars ile desteklenmiyorsa.
+        """
+        if extension in _LAZY_EXTENSIONS:
+            self.lazy = self._scan_with_polars(path, extension)
+            if nrows is None:
+                frame = self.lazy.collect(engine="streaming")
+            else:
+                frame = self.lazy.head(nrows).collect()
+        else:
+            raise ValueError(f"Unsupported file type for polars: {extension}")
+
+        return frame.to_pandas()
+
+    @staticmethod
+    def _scan_with_polars(path: Path, extension: str) -> "pl.LazyFrame":
+        """CSV veya TXT dosyası için Polars LazyFrame oluşturur.
+        
+        Kolon tipleri pandas'taki gibi tüm dosyaya bakılarak çıkarılır ve
+        pandas'ın eksik değer işaretleri null sayılır; Polars'ın varsayılanı
+        (ilk 100 satır) sonradan gelen "1.5" gibi değerlerde okumayı kırar.
+        
+        Args:
+            path (Path): Dosya yolu.
+            extension (str): Dosya uzantısı.
+        
+        Returns:
+            pl.LazyFrame: Henüz okunmamış sorgu planı.
+        """
+        options = {"infer_schema_length": None, "null_values": list(_POLARS_NULL_VALUES)}
+        if extension == FileExtension.TXT:
+            # Polars sep=None desteklemez; delimiter örnek üzerinden tespit edilir
+            return pl.scan_csv(
+                path, separator=_sniff_sep(path), try_parse_dates=True, **options
+            )
+        return pl.scan_csv(path, **options)
 
     def get_data(self) -> pd.DataFrame | None:
         """Okunan veriyi döndürür, eğer henüz okunmadıysa okur.
         
-        Lazy loading pattern kullanır. İlk çağrıda read_file() çağırır,
+        Lazy loading pattern kullanır. İlk çağrıda materialize() çağırır,
         sonraki çağrılarda cache'lenmiş veriyi döndürür.
         
         Returns:
@@ -317,7 +943,7 @@ class FileHandler:
             >>> data2 = handler.get_data()  # İkinci çağrı, cache'den döner
         """
         if self.data is None:
-            self.read_file()
+            self.materialize()
         return self.data
 
     def get_column_names(self) -> list[str]:
@@ -331,9 +957,12 @@ class FileHandler:
             >>> print(columns)
             ['Name', 'Age', 'City', 'Salary']
         """
-        if self.data is None:
-            return []
-        return self.data.columns.tolist()
+        if self.data is not None:
+            return self.data.columns.tolist()
+        if self.lazy is not None:
+            # Sadece şema çözümlenir, veri okunmaz
+            return self.lazy.collect_schema().names()
+        return []
 
     def preview_data(self, rows: int = 5):
         """Verinin önizlemesini konsola yazdırır.
@@ -351,12 +980,32 @@ class FileHandler:
             📋 Columns: Name, Age, City, Salary, Department
         
         Note:
-            Veri henüz okunmadıysa hiçbir şey yapmaz (None döner).
+            Veri henüz okunmadıysa (tembel açılmış olsa da) sadece ilk N satır
+            okunur; bu kısmi veri self.data'ya yazılmaz ve satır sayısı
+            gösterilmez.
         """
-        if self.data is None:
-            return
+        if self.data is not None:
+            head = self.data.head(rows)
+            n_rows, n_cols = self.data.shape
+        elif self.lazy is not None:
+            # Tembel açılmış dosyada sadece ilk satırlar okunur; satır sayısı
+            # için dosyanın tamamı taranmaz
+            head = self.lazy.head(rows).collect().to_pandas()
+            n_rows, n_cols = None, len(head.columns)
+        else:
+            # Önizleme için tüm dosya okunmaz; cache'lenen veri değişmez
+            head = self.read_file(nrows=rows)
+            n_rows, n_cols = None, len(head.columns)
 
         print(f"\n📊 Data Preview (first {rows} rows):")
-        print(self.data.head(rows).to_string())
-        print(f"\n📈 Shape: {self.data.shape[0]} rows × {self.data.shape[1]} columns")
-        print(f"📋 Columns: {', '.join(self.get_column_names())}")
+        # to_string() tüm kolonları tek dev string'e formatlar; repr genişliğe
+        # göre kırpar ve sadece görünen kolonları formatlar
+        with pd.option_context(
+            "display.max_columns", _PREVIEW_MAX_COLUMNS, "display.width", _PREVIEW_WIDTH
+        ):
+            print(head)
+        if n_rows is None:
+            print(f"\n📈 Shape: {n_cols} columns")
+        else:
+            print(f"\n📈 Shape: {n_rows} rows × {n_cols} columns")
+        print(f"📋 Columns: {', '.join(map(str, head.columns))}")
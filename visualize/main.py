@@ -8,13 +8,9 @@ Example:
 
         $ python -m visualize.main
 
-    veya doğrudan::
-
-        $ python visualize/main.py
-
 Note:
-    Bu dosya direkt olarak çalıştırılmalıdır. Başka modüller tarafından
-   import edilmesi amaçlanmamıştır.
+    Bu dosya paket modülü olarak (-m ile) çalıştırılmalıdır. Başka modüller
+   tarafından import edilmesi amaçlanmamıştır.
 
 Attributes:
     cli_config (CLIConfig): CLI konfigürasyon nesnesi, varsayılan veri yolunu içerir.
@@ -22,24 +18,15 @@ Attributes:
 """
 
 import sys
-import os
-
-# Modül import sorunlarını çözmek için path ayarı
-# Hem 'python -m visualize.main' hem de 'python visualize/main.py' çalışmasını sağlar
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+from importlib.resources import files
 
-try:
-    from cli import CLI, CLIConfig
-except ImportError:
-    # Fallback for module execution
-    from visualize.cli import CLI, CLIConfig
+from visualize.cli import CLI, CLIConfig
+from visualize.file import FileReadError, FileValidationError
 
 if "__main__" == __name__:
     # Varsayılan veri klasörü ile CLI yapılandırması oluştur
-    # Veri klasörü visualize/data altında varsayılıyor
-    data_path = os.path.join(current_dir, "data")
+    # Veri klasörü paketle birlikte gelen visualize/data
+    data_path = str(files("visualize").joinpath("data"))
     
     cli_config: CLIConfig = CLIConfig(path=data_path)
     
@@ -47,4 +34,8 @@ if "__main__" == __name__:
     cli: CLI = CLI(cli_config)
     
     # İnteraktif workflow'u çalıştır
-    cli.run()
+    # Dosya hataları modüllerden exception olarak gelir, burada mesajla çıkılır
+    try:
+        cli.run()
+    except (FileValidationError, FileReadError) as e:
+        sys.exit(str(e))
@@ -17,37 +17,416 @@ Classes:
 Example:
     Temel kullanım::
 
-        from visualize import VisualizationWorkflow
+        from visualize.visualize import VisualizationWorkflow
         
         workflow = VisualizationWorkflow()
         workflow.run("data.csv")
 """
 
+from __future__ import annotations
+
+import importlib.util
+import multiprocessing
+import os
+import stat
 import sys
+import zlib
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from file import File, FileHandler
-from InquirerPy import inquirer
+from ._agg import group_sum, histogram
+from ._downsample import lttb_series
+from .file import File, FileError, FileHandler, FileValidationError
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
-# GUI Backend ayarları
+
+# datashader opsiyoneldir: çok büyük serileri nokta nokta çizmek yerine
+# sabit boyutlu bir görüntüye rasterize eder. Yüklü değilse matplotlib kullanılır.
 try:
-    matplotlib.use("TkAgg")  # Try TkAgg first (most common)
+    import datashader as ds
+    import datashader.transfer_functions as tf
 except ImportError:
-    try:
-        matplotlib.use("Qt5Agg")  # Try Qt5Agg
-    except ImportError:
-        try:
-            matplotlib.use("GTK3Agg")  # Try GTK3Agg
-        except ImportError:
-            print("⚠️  Warning: No GUI backend found. Using default backend.")
+    ds = None
+
+
+_KEYBINDINGS = {"interrupt": [{"key": "q"}]}
+"""Tüm prompt'larda ortak tuş ataması (q: KeyboardInterrupt). InquirerPy
+sözlüğü kopyalayarak birleştirdiği için tek nesne paylaşılabilir."""
+
+_BACKEND: str | None = None
+"""Seçilen matplotlib backend'i; ilk çizimde _pyplot() tarafından belirlenir."""
+
+_IS_INTERACTIVE = False
+"""Backend bir GUI backend'i mi; _BACKEND ile birlikte bir kez hesaplanır."""
+
+_GUI_BACKENDS: tuple[tuple[str, str], ...] = (
+    ("tkinter", "TkAgg"),
+    ("PyQt5", "Qt5Agg"),
+    ("gi", "GTK3Agg"),
+)
+"""Sırayla denenen (toolkit modülü, matplotlib backend'i) çiftleri."""
+
+_POOL_MIN_FILES = 8
+"""Dosyaya kaydetme modunda süreç havuzunun kullanıldığı en az dosya sayısı.
+Her spawn worker'ı pandas/matplotlib'i yeniden import eder (yaklaşık bir
+saniye); küçük toplu işler bu maliyeti çıkaramaz ve sıralı çizilir."""
+
+_POOL_MIN_BYTES = 64 * 1024 * 1024
+"""Dosya sayısı az olsa da toplam boyutu bunu aşan toplu işler paralel çizilir;
+büyük dosyalarda okuma ve çizim süresi worker başlatma maliyetini aşar."""
+
+_SEPARATOR = "=" * 50
+# Bölüm başlıkları tek bir write ile yazdırılır: "\n=====\n<başlık>\n=====\n"
+_SECTION_TEMPLATE = "\n" + _SEPARATOR + "\n{}\n" + _SEPARATOR + "\n"
+
+_RASTER_THRESHOLD = 50_000
+"""Bu satır sayısından büyük seriler (datashader varsa) rasterize edilir."""
+
+_RASTER_SIZE = (1200, 700)
+
+_DEFAULT_DPI = 100
+"""Kaydedilen PNG'lerin varsayılan çözünürlüğü; Agg maliyeti piksel sayısıyla artar."""
+
+_PNG_COMPRESS_LEVEL = 1
+"""PNG zlib sıkıştırma seviyesi (0-9). Düşük seviye, biraz daha büyük dosya
+karşılığında kaydetmeyi birkaç kat hızlandırır."""
+
+_PNG_COMPRESS_TYPE = zlib.Z_RLE
+"""zlib stratejisi. Grafiklerdeki düz renk alanlarında RLE, varsayılan
+stratejiyle aynı hızda yaklaşık %20 daha küçük dosya üretir."""
+
+_LTTB_TARGET = 10 * _DEFAULT_DPI
+"""Çizgi grafiği için hedef nokta sayısı: figür genişliği (inç) × dpi."""
+
+_MAX_BARS = _LTTB_TARGET
+"""Figür genişliğindeki piksel sayısı; bundan fazla çubuk ayırt edilemez."""
+
+_MARKER_LIMIT = 5000
+"""Çizgi grafiğinde bu sayıdan fazla nokta çizilecekse marker kullanılmaz;
+marker'lar her noktanın ayrı çizilmesini gerektirir ve yol sadeleştirmeyi
+devre dışı bırakır."""
+
+_RC_PARAMS = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10_000,
+}
+"""Backend seçilirken uygulanan matplotlib ayarları: uzun çizgiler en fazla
+bir piksel sapmayla sadeleştirilir ve Agg'de parçalar halinde çizilir."""
+
+_COMPOSABLE_AGGS = frozenset({"sum", "min", "max"})
+"""Gruplanmış sonuçların tekrar gruplanmasıyla aynı sonucu veren toplamalar."""
+
+_KERNEL_AGG_THRESHOLD = 1_000_000
+"""Bu satır sayısından büyük çubuk grafiklerinde "sum" toplaması
+_agg.group_sum ile (numba varsa çok çekirdekli) yapılır."""
+
+_MAX_TABLE_ROWS = 500
+"""Tablo görünümünde gösterilebilecek en fazla satır; matplotlib tabloları
+bu sayının üzerinde doğrusal olmayan şekilde yavaşlar."""
+
+_TABLE_HEADER_COLOR = "#4472C4"
+"""Tablo başlık satırının arka plan rengi."""
+
+_TABLE_ROW_INCHES = 0.33
+"""Tablo satırı başına figür yüksekliği (inç)."""
+
+_TABLE_CHAR_INCHES = 0.08
+"""9 punto hücre metninde karakter başına kolon genişliği (inç)."""
+
+_TABLE_CELL_PAD_INCHES = 0.25
+"""Kolon başına metnin iki yanına bırakılan toplam boşluk (inç)."""
+
+_TABLE_TITLE_INCHES = 0.6
+"""Tablo başlığı için figür yüksekliğine eklenen pay (inç)."""
+
+_TABLE_MIN_WIDTH = 14
+"""Tablo figürünün en küçük genişliği (inç); dar tablolar bu genişliğe yayılır."""
+
+_TABLE_TEXT_ENV = "VIZ_TABLE_TEXT"
+"""Bu ortam değişkeni "1" ise GUI olmayan ortamda tablolar PNG yerine düz
+metin (.txt) olarak yazılır; config["text"] verilmişse o kullanılır."""
+
+
+def _pyplot():
+    """matplotlib.pyplot'u ilk kullanımda import eder ve backend'i seçer.
+    
+    matplotlib'in import ve font yöneticisi maliyeti modül import'unda değil
+    ilk çizimde ödenir. GUI backend tespiti sadece bir kez yapılır; hiçbir
+    GUI backend'i yüklenemezse uyarı yazdırılır, Agg seçilir ve grafikler
+    dosyaya kaydedilir.
+    
+    Returns:
+        module: matplotlib.pyplot modülü.
+    """
+    global _BACKEND, _IS_INTERACTIVE
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    if _BACKEND is None:
+        # GUI Backend ayarları: kurulu olmayan toolkit'ler import edilmeden
+        # atlanır; kurulu olan yüklenemezse (örn. eksik _tkinter veya ekran
+        # yok) sıradaki denenir
+        for module, backend in _GUI_BACKENDS:
+            if importlib.util.find_spec(module) is None:
+                continue
+            try:
+                matplotlib.use(backend)
+                break
+            except ImportError:
+                continue
+        else:
+            print("⚠️  Warning: No GUI backend found. Charts will be saved as PNG files.")
             print("   Install one of: python3-tk, PyQt5, or PyGObject")
             matplotlib.use("Agg")
-            sys.exit()
+        matplotlib.rcParams.update(_RC_PARAMS)
+        _BACKEND = matplotlib.get_backend()
+        _IS_INTERACTIVE = _BACKEND.lower() != "agg"
+    return plt
+
+
+def _should_rasterize(data: pd.DataFrame, x_col: str, y_col: str, config: dict) -> bool:
+    """Serinin datashader ile rasterize edilip edilmeyeceğine karar verir.
+    
+    config["backend"] "matplotlib" ise hiç, "datashader" ise her zaman;
+    belirtilmemişse satır sayısı config["raster_threshold"]'u (varsayılan
+    50_000) aşınca rasterize edilir. datashader yüklü değilse veya kolonlar
+    sayısal değilse her zaman matplotlib kullanılır.
+    
+    Args:
+        data (pd.DataFrame): Görselleştirilecek veri.
+        x_col (str): X ekseni kolon adı.
+        y_col (str): Y ekseni kolon adı.
+        config (dict): Grafik konfigürasyonu.
+    
+    Returns:
+        bool: Rasterize edilecekse True.
+    """
+    backend = config.get("backend")
+    if ds is None or backend == "matplotlib":
+        return False
+    if not (
+        pd.api.types.is_numeric_dtype(data[x_col])
+        and pd.api.types.is_numeric_dtype(data[y_col])
+    ):
+        return False
+    return backend == "datashader" or len(data) > config.get(
+        "raster_threshold", _RASTER_THRESHOLD
+    )
+
+
+def _downcast(frame: pd.DataFrame) -> pd.DataFrame:
+    """Sayısal kolonları değer kaybı olmadan float32'ye indirger.
+    
+    Kolonlar önce NumPy float64 dizisine çevrilir (pyarrow dtype'ları
+    datashader'a gitmez), sonra pd.to_numeric(downcast="float") ile değerler
+    float32'de aynı kalıyorsa float32'ye indirilir; böylece rasterize
+    sırasında okunan bellek yarıya iner. Büyük ofsetli seriler (örn. epoch
+    zaman damgaları) float64 kalır.
+    
+    Args:
+        frame (pd.DataFrame): Eksik değerleri atılmış sayısal kolonlar.
+    
+    Returns:
+        pd.DataFrame: Aynı kolonlarla yeni DataFrame; girdi değiştirilmez.
+    """
+    return pd.DataFrame(
+        {
+            name: pd.to_numeric(column.to_numpy(dtype="float64"), downcast="float")
+            for name, column in frame.items()
+        },
+        index=frame.index,
+    )
+
+
+def _render_datashader(
+    ax: plt.Axes, data: pd.DataFrame, x_col: str, y_col: str, glyph: str = "line"
+):
+    """Seriyi datashader ile rasterize edip eksene görüntü olarak çizer.
+    
+    Args:
+        ax (plt.Axes): Çizimin yapılacağı eksen.
+        data (pd.DataFrame): Görselleştirilecek veri.
+        x_col (str): X ekseni kolon adı.
+        y_col (str): Y ekseni kolon adı.
+        glyph (str, optional): Canvas glyph'i ("line" veya "points").
+    """
+    frame = _downcast(data[[x_col, y_col]].dropna())
+    x_range = (frame[x_col].min(), frame[x_col].max())
+    y_range = (frame[y_col].min(), frame[y_col].max())
+
+    width, height = _RASTER_SIZE
+    canvas = ds.Canvas(
+        plot_width=width, plot_height=height, x_range=x_range, y_range=y_range
+    )
+    agg = getattr(canvas, glyph)(frame, x_col, y_col)
+    image = tf.shade(agg).to_pil()
+
+    ax.imshow(image, extent=[*x_range, *y_range], aspect="auto")
+
+
+def _prepare_axes(ax: plt.Axes | None, figsize: tuple[float, float]) -> plt.Axes:
+    """Çizim için ekseni hazırlar.
+    
+    Eksen verilmemişse yeni bir figür oluşturulur. Verilmişse (örn.
+    VisualizationHandler'ın cache'lediği eksen) temizlenip figür boyutu
+    ayarlanır; böylece her grafik için yeni canvas oluşturulmaz. Kenar
+    boşlukları figürün "constrained" layout engine'i ile çizim sırasında
+    ayarlandığından grafik başına tight_layout() çağrılmaz.
+    
+    Args:
+        ax (plt.Axes | None): Yeniden kullanılacak eksen.
+        figsize (tuple[float, float]): Figür boyutu (inç).
+    
+    Returns:
+        plt.Axes: Çizime hazır eksen.
+    """
+    if ax is None:
+        _, ax = _pyplot().subplots(figsize=figsize, layout="constrained")
+        return ax
+
+    ax.clear()
+    ax.set_axis_on()
+    if ax.figure.get_layout_engine() is None:
+        ax.figure.set_layout_engine("constrained")
+    ax.figure.set_size_inches(figsize)
+    return ax
+
+
+def _show_or_save(
+    fig: plt.Figure, filename: str, config: dict, owns_figure: bool, label: str
+):
+    """GUI backend'i varsa figürü gösterir, yoksa PNG olarak kaydeder.
+    
+    Args:
+        fig (plt.Figure): Gösterilecek veya kaydedilecek figür.
+        filename (str): Kaydetme durumunda çıktı dosya adı.
+        config (dict): Grafik konfigürasyonu (dpi, png_level).
+        owns_figure (bool): Figür çağıran tarafından oluşturulduysa True;
+            kaydettikten sonra kapatılır.
+        label (str): Mesajlarda kullanılan grafik adı (örn. "Line Chart").
+    """
+    plt = _pyplot()
+    if _IS_INTERACTIVE:
+        plt.show()
+        return
+
+    _save_figure(fig, filename, config)
+    print(f"✅ {label} saved as: {filename}")
+    if owns_figure:
+        plt.close(fig)
+
+
+def _output_filename(name: str, config: dict, extension: str = ".png") -> str:
+    """Kaydedilecek çıktının dosya adını oluşturur.
+    
+    Toplu işlemde aynı grafik birden fazla dosya için üretildiğinden
+    config["source"] verilmişse dosya adının başına eklenir; aksi halde
+    eşzamanlı çizen süreçler aynı dosyanın üzerine yazar.
+    
+    Args:
+        name (str): Grafik türüne özgü dosya adı gövdesi.
+        config (dict): Grafik konfigürasyonu (source).
+        extension (str, optional): Dosya uzantısı. Varsayılan ".png".
+    
+    Returns:
+        str: Çıktı dosya adı.
+    """
+    source = config.get("source")
+    return f"{source}_{name}{extension}" if source else f"{name}{extension}"
+
+
+def _pad_series(
+    series: list[tuple[str, np.ndarray, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Datetime X'li serileri tek bir (N, K) dizi çiftine yerleştirir.
+    
+    Kısa seriler NaT/NaN ile doldurulur; Agg bu noktaları çizmez. Böylece K
+    çizgi tek bir ax.plot çağrısıyla çizilir.
+    
+    Args:
+        series (list[tuple[str, np.ndarray, np.ndarray]]): (isim, X, Y) serileri.
+    
+    Returns:
+        tuple[np.ndarray, np.ndarray] | None: (N, K) boyutlu X ve Y dizileri.
+            X datetime64 veya Y sayısal değilse (örn. kategorik X) None.
+    """
+    if not all(
+        np.issubdtype(xs.dtype, np.datetime64) and np.issubdtype(ys.dtype, np.number)
+        for _, xs, ys in series
+    ):
+        return None
+
+    n_rows = max(len(xs) for _, xs, _ in series)
+    padded_x = np.full((n_rows, len(series)), np.datetime64("NaT"), dtype="datetime64[ns]")
+    padded_y = np.full((n_rows, len(series)), np.nan)
+    for i, (_, xs, ys) in enumerate(series):
+        padded_x[: len(xs), i] = xs
+        padded_y[: len(ys), i] = ys
+    return padded_x, padded_y
+
+
+def _format_cells(frame: pd.DataFrame) -> list[list[str]]:
+    """DataFrame'i tablo hücreleri için string matrisine çevirir.
+    
+    Biçimlendirme kolon bazında yapılır (ondalıklı kolonlar np.char.mod ile
+    tek çağrıda 6 anlamlı basamakla, diğerleri str ile); karışık tipli bir
+    object kopyası ve hücre başına tip tespiti yapılmaz. Eksik değerler boş
+    gösterilir.
+    
+    Args:
+        frame (pd.DataFrame): Gösterilecek veri.
+    
+    Returns:
+        list[list[str]]: Satır satır hücre metinleri.
+    """
+    columns = []
+    for name in frame.columns:
+        column = frame[name]
+        missing = column.isna()
+        if pd.api.types.is_float_dtype(column):
+            values = column.to_numpy(dtype="float64", na_value=np.nan)
+            text = np.char.mod("%.6g", values)
+        else:
+            text = column.astype(str).to_numpy()
+        columns.append(np.where(missing.to_numpy(), "", text).tolist())
+    return [list(row) for row in zip(*columns)]
+
+
+def _save_figure(fig: plt.Figure, filename: str, config: dict):
+    """Figürü PNG olarak kaydeder.
+    
+    Figür Agg canvas'ına bir kez çizilir ve RGBA buffer'ı kopyalanmadan
+    Pillow ile düşük zlib seviyesinde yazılır. savefig'in bbox_inches="tight"
+    için yaptığı ikinci çizim turu yapılmaz; kenar boşlukları figüre bir kez
+    atanan "constrained" layout engine'i tarafından çizim sırasında ayarlanır.
+    
+    Args:
+        fig (plt.Figure): Kaydedilecek figür.
+        filename (str): Çıktı dosya adı.
+        config (dict): Grafik konfigürasyonu.
+            - dpi (int, optional): Çözünürlük (varsayılan 100).
+            - png_level (int, optional): zlib sıkıştırma seviyesi (varsayılan 1).
+    """
+    from PIL import Image
+
+    fig.set_dpi(config.get("dpi", _DEFAULT_DPI))
+    fig.canvas.draw()
+    size = fig.canvas.get_width_height(physical=True)
+    image = Image.frombuffer("RGBA", size, fig.canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+    image.save(
+        filename,
+        "PNG",
+        compress_level=config.get("png_level", _PNG_COMPRESS_LEVEL),
+        compress_type=_PNG_COMPRESS_TYPE,
+        optimize=False,
+    )
 
 
 class VisualizationType(Enum):
@@ -66,6 +445,20 @@ class VisualizationType(Enum):
     TABLE = "Table"
 
 
+_VIZ_TYPES: tuple[VisualizationType, ...] = tuple(VisualizationType)
+_VIZ_VALUES: tuple[str, ...] = tuple(viz_type.value for viz_type in _VIZ_TYPES)
+_VIZ_BY_VALUE: dict[str, VisualizationType] = {
+    viz_type.value: viz_type for viz_type in _VIZ_TYPES
+}
+"""Prompt'ta seçilen etiketten VisualizationType'a O(1) eşleme."""
+
+_COMPARISON_VIZ_VALUES: tuple[str, ...] = (
+    VisualizationType.LINE_CHART.value,
+    VisualizationType.BAR_CHART.value,
+)
+"""Karşılaştırma modunda seçilebilen grafik tipleri."""
+
+
 class VisualizationStrategy(ABC):
     """Görselleştirme stratejileri için soyut temel sınıf (Abstract Base Class).
     
@@ -74,12 +467,17 @@ class VisualizationStrategy(ABC):
     """
 
     @abstractmethod
-    def create_visualization(self, data: pd.DataFrame, config: dict):
+    def create_visualization(
+        self, data: pd.DataFrame, config: dict, ax: plt.Axes | None = None
+    ):
         """Spesifik bir grafik türü oluşturur.
         
         Args:
             data (pd.DataFrame): Görselleştirilecek veri.
             config (dict): Grafik konfigürasyonu (başlık, eksenler vb.).
+            ax (plt.Axes | None, optional): Çizimin yapılacağı eksen. Verilirse
+                temizlenip yeniden kullanılır ve figür kapatılmaz; verilmezse
+                yeni figür oluşturulur.
         
         Raises:
             NotImplementedError: Alt sınıflar bu methodu implement etmelidir.
@@ -90,7 +488,9 @@ class VisualizationStrategy(ABC):
 class LineChartStrategy(VisualizationStrategy):
     """Çizgi grafiği (Line Chart) oluşturma stratejisi."""
 
-    def create_visualization(self, data: pd.DataFrame, config: dict):
+    def create_visualization(
+        self, data: pd.DataFrame, config: dict, ax: plt.Axes | None = None
+    ):
         """Verilen veri ve konfigürasyon ile çizgi grafiği oluşturur.
         
         Args:
@@ -99,6 +499,12 @@ class LineChartStrategy(VisualizationStrategy):
                 - x_axis (str): X ekseni kolon adı.
                 - y_axis (str): Y ekseni kolon adı.
                 - title (str, optional): Grafik başlığı.
+                - backend (str, optional): "matplotlib" veya "datashader".
+                  Belirtilmezse büyük serilerde datashader kullanılır.
+                - raster_threshold (int, optional): Otomatik rasterize eşiği.
+                - source (str, optional): Çıktı dosya adının başına eklenen
+                  kaynak dosya adı.
+            ax (plt.Axes | None, optional): Yeniden kullanılacak eksen.
         
         Example:
             >>> strategy = LineChartStrategy()
@@ -106,36 +512,39 @@ class LineChartStrategy(VisualizationStrategy):
             >>> strategy.create_visualization(df, config)
         """
         print("📈 Creating Line Chart...")
+        plt = _pyplot()
 
         x_col = config.get("x_axis")
         y_col = config.get("y_axis")
         title = config.get("title", "Line Chart")
 
-        plt.figure(figsize=(10, 6))
-        plt.plot(
-            data[x_col],
-            data[y_col],
-            marker="o",
-            linestyle="-",
-            linewidth=2,
-            markersize=6,
-        )
-        plt.xlabel(x_col, fontsize=12)
-        plt.ylabel(y_col, fontsize=12)
-        plt.title(title, fontsize=14, fontweight="bold")
-        plt.grid(True, alpha=0.3)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
-        # Check if we can show interactive plot
-        if matplotlib.get_backend() != "Agg":
-            plt.show()
+        owns_figure = ax is None
+        ax = _prepare_axes(ax, (10, 6))
+        if _should_rasterize(data, x_col, y_col, config):
+            _render_datashader(ax, data, x_col, y_col, glyph="line")
         else:
-            # Save to file if no GUI available
-            filename = f"line_chart_{x_col}_{y_col}.png"
-            plt.savefig(filename, dpi=150, bbox_inches="tight")
-            print(f"✅ Line Chart saved as: {filename}")
-            plt.close()
+            x_values, y_values = data[x_col], data[y_col]
+            if len(data) > 4 * _LTTB_TARGET:
+                # Piksel sayısından çok nokta çizmek görüntüyü değiştirmez
+                downsampled = lttb_series(x_values, y_values, _LTTB_TARGET)
+                if downsampled is not None:
+                    x_values, y_values = downsampled
+            ax.plot(
+                x_values,
+                y_values,
+                marker="o" if len(x_values) <= _MARKER_LIMIT else None,
+                linestyle="-",
+                linewidth=2,
+                markersize=6,
+            )
+        ax.set_xlabel(x_col, fontsize=12)
+        ax.set_ylabel(y_col, fontsize=12)
+        ax.set_title(title, fontsize=14, fontweight="bold")
+        ax.grid(True, alpha=0.3)
+        plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+
+        filename = _output_filename(f"line_chart_{x_col}_{y_col}", config)
+        _show_or_save(ax.figure, filename, config, owns_figure, "Line Chart")
 
         print("✅ Line Chart created successfully!")
 
@@ -143,7 +552,9 @@ class LineChartStrategy(VisualizationStrategy):
 class BarChartStrategy(VisualizationStrategy):
     """Çubuk grafiği (Bar Chart) oluşturma stratejisi."""
 
-    def create_visualization(self, data: pd.DataFrame, config: dict):
+    def create_visualization(
+        self, data: pd.DataFrame, config: dict, ax: plt.Axes | None = None
+    ):
         """Verilen veri ve konfigürasyon ile çubuk grafiği oluşturur.
         
         Args:
@@ -152,28 +563,69 @@ class BarChartStrategy(VisualizationStrategy):
                 - x_axis (str): Kategorik eksen (X).
                 - y_axis (str): Değer ekseni (Y).
                 - title (str, optional): Grafik başlığı.
+                - backend (str, optional): "matplotlib" veya "datashader".
+                  Belirtilmezse gruplamadan sonra da çok sayıda sayısal çubuk
+                  kalırsa datashader kullanılır.
+                - raster_threshold (int, optional): Otomatik rasterize eşiği
+                  (çubuk sayısı).
+                - agg (str, optional): Aynı X değerlerinin Y'sini birleştirme
+                  fonksiyonu ("sum", "mean" vb.). Varsayılan "sum". "sum",
+                  "min" ve "max" ile sayısal X'te figür genişliğinden fazla
+                  çubuk olursa X aralıklara bölünür.
+                - source (str, optional): Çıktı dosya adının başına eklenen
+                  kaynak dosya adı.
+            ax (plt.Axes | None, optional): Yeniden kullanılacak eksen.
         """
         print("📊 Creating Bar Chart...")
+        plt = _pyplot()
 
         x_col = config.get("x_axis")
         y_col = config.get("y_axis")
         title = config.get("title", "Bar Chart")
 
-        plt.figure(figsize=(10, 6))
-        plt.bar(data[x_col], data[y_col], color="steelblue", alpha=0.8)
-        plt.xlabel(x_col, fontsize=12)
-        plt.ylabel(y_col, fontsize=12)
-        plt.title(title, fontsize=14, fontweight="bold")
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
-        if matplotlib.get_backend() != "Agg":
-            plt.show()
+        owns_figure = ax is None
+        ax = _prepare_axes(ax, (10, 6))
+        if pd.api.types.is_numeric_dtype(data[y_col]):
+            # Aynı kategoriler tek çubukta toplanır; N satır yerine K patch
+            # çizilir. Rasterize kararı satır değil çubuk sayısına göre verilir
+            agg = config.get("agg", "sum")
+            if agg == "sum" and len(data) > _KERNEL_AGG_THRESHOLD:
+                grouped = group_sum(data[x_col], data[y_col])
+            else:
+                grouped = data.groupby(x_col, sort=False, observed=True)[y_col].agg(agg)
+            if (
+                len(grouped) > _MAX_BARS
+                and agg in _COMPOSABLE_AGGS
+                and pd.api.types.is_numeric_dtype(grouped.index)
+            ):
+                # Sayısal X'te piksel sayısından fazla çubuk yerine X aralıklara
+                # bölünür ve her aralık tek çubukla çizilir
+                grouped = grouped.groupby(
+                    pd.cut(grouped.index, _MAX_BARS), observed=True
+                ).agg(agg)
+                intervals = pd.IntervalIndex(grouped.index)
+                ax.bar(
+                    intervals.mid,
+                    grouped.to_numpy(),
+                    width=intervals.length,
+                    color="steelblue",
+                    alpha=0.8,
+                )
+            else:
+                frame = grouped.rename_axis(x_col).reset_index(name=y_col)
+                if _should_rasterize(frame, x_col, y_col, config):
+                    _render_datashader(ax, frame, x_col, y_col, glyph="points")
+                else:
+                    ax.bar(grouped.index, grouped.to_numpy(), color="steelblue", alpha=0.8)
         else:
-            filename = f"bar_chart_{x_col}_{y_col}.png"
-            plt.savefig(filename, dpi=150, bbox_inches="tight")
-            print(f"✅ Bar Chart saved as: {filename}")
-            plt.close()
+            ax.bar(data[x_col], data[y_col], color="steelblue", alpha=0.8)
+        ax.set_xlabel(x_col, fontsize=12)
+        ax.set_ylabel(y_col, fontsize=12)
+        ax.set_title(title, fontsize=14, fontweight="bold")
+        plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+
+        filename = _output_filename(f"bar_chart_{x_col}_{y_col}", config)
+        _show_or_save(ax.figure, filename, config, owns_figure, "Bar Chart")
 
         print("✅ Bar Chart created successfully!")
 
@@ -181,7 +633,9 @@ class BarChartStrategy(VisualizationStrategy):
 class HistogramStrategy(VisualizationStrategy):
     """Histogram oluşturma stratejisi."""
 
-    def create_visualization(self, data: pd.DataFrame, config: dict):
+    def create_visualization(
+        self, data: pd.DataFrame, config: dict, ax: plt.Axes | None = None
+    ):
         """Verilen veri ve konfigürasyon ile histogram oluşturur.
         
         Args:
@@ -190,6 +644,9 @@ class HistogramStrategy(VisualizationStrategy):
                 - column (str): Analiz edilecek kolon.
                 - bins (int, optional): Bin sayısı. Varsayılan 30.
                 - title (str, optional): Grafik başlığı.
+                - source (str, optional): Çıktı dosya adının başına eklenen
+                  kaynak dosya adı.
+            ax (plt.Axes | None, optional): Yeniden kullanılacak eksen.
         """
         print("📊 Creating Histogram...")
 
@@ -197,23 +654,27 @@ class HistogramStrategy(VisualizationStrategy):
         title = config.get("title", f"Histogram of {column}")
         bins = config.get("bins", 30)
 
-        plt.figure(figsize=(10, 6))
-        plt.hist(
-            data[column].dropna(), bins=bins, color="teal", alpha=0.7, edgecolor="black"
+        owns_figure = ax is None
+        ax = _prepare_axes(ax, (10, 6))
+        # Kutular önceden sayılır (numba varsa çok çekirdekli); matplotlib'e
+        # sadece bin başına bir çubuk gider
+        counts, edges = histogram(data[column], bins)
+        ax.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align="edge",
+            color="teal",
+            alpha=0.7,
+            edgecolor="black",
         )
-        plt.xlabel(column, fontsize=12)
-        plt.ylabel("Frequency", fontsize=12)
-        plt.title(title, fontsize=14, fontweight="bold")
-        plt.grid(True, alpha=0.3, axis="y")
-        plt.tight_layout()
-
-        if matplotlib.get_backend() != "Agg":
-            plt.show()
-        else:
-            filename = f"histogram_{column}.png"
-            plt.savefig(filename, dpi=150, bbox_inches="tight")
-            print(f"✅ Histogram saved as: {filename}")
-            plt.close()
+        ax.set_xlabel(column, fontsize=12)
+        ax.set_ylabel("Frequency", fontsize=12)
+        ax.set_title(title, fontsize=14, fontweight="bold")
+        ax.grid(True, alpha=0.3, axis="y")
+
+        filename = _output_filename(f"histogram_{column}", config)
+        _show_or_save(ax.figure, filename, config, owns_figure, "Histogram")
 
         print("✅ Histogram created successfully!")
 
@@ -221,53 +682,87 @@ class HistogramStrategy(VisualizationStrategy):
 class TableStrategy(VisualizationStrategy):
     """Tablo görünümü oluşturma stratejisi."""
 
-    def create_visualization(self, data: pd.DataFrame, config: dict):
+    def create_visualization(
+        self, data: pd.DataFrame, config: dict, ax: plt.Axes | None = None
+    ):
         """Veriyi matplotlib tablosu olarak görselleştirir.
         
         Args:
             data (pd.DataFrame): Görselleştirilecek veri.
             config (dict): Konfigürasyon sözlüğü.
-                - rows (int, optional): Gösterilecek satır sayısı. Varsayılan 10.
+                - rows (int, optional): Gösterilecek satır sayısı. Varsayılan 10,
+                  en fazla 500; fazlası istenirse uyarı yazdırılır.
                 - title (str, optional): Tablo başlığı.
+                - text (bool, optional): GUI yokken tabloyu matplotlib ile
+                  çizmek yerine düz metin olarak yaz. Varsayılan, VIZ_TABLE_TEXT
+                  ortam değişkeninin "1" olması.
+                - source (str, optional): Çıktı dosya adının başına eklenen
+                  kaynak dosya adı.
+            ax (plt.Axes | None, optional): Yeniden kullanılacak eksen.
         """
         print("📋 Creating Table...")
 
         title = config.get("title", "Data Table")
         rows = config.get("rows", 10)
+        if rows > _MAX_TABLE_ROWS:
+            print(f"⚠️  Table limited to {_MAX_TABLE_ROWS} rows ({rows} requested)")
+            rows = _MAX_TABLE_ROWS
 
         display_data = data.head(rows)
 
-        fig, ax = plt.subplots(figsize=(14, max(4, rows * 0.4)))
-        ax.axis("tight")
+        as_text = config.get("text", os.environ.get(_TABLE_TEXT_ENV) == "1")
+        if as_text:
+            _pyplot()  # GUI backend'i olup olmadığı ilk çağrıda belirlenir
+        if as_text and not _IS_INTERACTIVE:
+            # Metin için figür, layout ve PNG kodlaması gerekmez
+            text = display_data.to_string(index=False)
+            filename = _output_filename(f"table_{title.replace(' ', '_')}", config, ".txt")
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(f"{title}\n\n{text}\n")
+            print(text)
+            print(f"✅ Table saved as: {filename}")
+            return
+
+        cells = _format_cells(display_data)
+        labels = [str(column) for column in display_data.columns]
+        # Figür içeriğe göre boyutlanır ve tablo eksenin tamamını kaplar;
+        # kaydederken kırpma yapılmadığından geniş tablolarda metin kesilmez,
+        # kısa tablolarda boş kenar kalmaz
+        col_inches = [
+            max(map(len, column)) * _TABLE_CHAR_INCHES + _TABLE_CELL_PAD_INCHES
+            for column in zip(labels, *cells)
+        ]
+        total_inches = sum(col_inches)
+        figsize = (
+            max(_TABLE_MIN_WIDTH, total_inches),
+            (len(cells) + 1) * _TABLE_ROW_INCHES + _TABLE_TITLE_INCHES,
+        )
+
+        owns_figure = ax is None
+        ax = _prepare_axes(ax, figsize)
         ax.axis("off")
 
         table = ax.table(
-            cellText=display_data.values,
-            colLabels=display_data.columns,
+            cellText=cells,
+            colLabels=labels,
+            colWidths=[inches / total_inches for inches in col_inches],
             cellLoc="center",
-            loc="center",
-            colColours=["#4472C4"] * len(display_data.columns),
+            bbox=(0, 0, 1, 1),
+            colColours=[_TABLE_HEADER_COLOR] * len(labels),
         )
 
         table.auto_set_font_size(False)
         table.set_fontsize(9)
-        table.scale(1, 2)
 
-        # Style header
-        for i in range(len(display_data.columns)):
-            table[(0, i)].set_facecolor("#4472C4")
-            table[(0, i)].set_text_props(weight="bold", color="white")
+        # Style header (arka plan rengi colColours ile zaten verildi); tüm
+        # hücreler yerine sadece başlık satırı dolaşılır
+        for col in range(len(labels)):
+            table[0, col].set_text_props(weight="bold", color="white")
 
-        plt.title(title, fontsize=14, fontweight="bold", pad=20)
-        plt.tight_layout()
+        ax.set_title(title, fontsize=14, fontweight="bold")
 
-        if matplotlib.get_backend() != "Agg":
-            plt.show()
-        else:
-            filename = f"table_{title.replace(' ', '_')}.png"
-            plt.savefig(filename, dpi=150, bbox_inches="tight")
-            print(f"✅ Table saved as: {filename}")
-            plt.close()
+        filename = _output_filename(f"table_{title.replace(' ', '_')}", config)
+        _show_or_save(ax.figure, filename, config, owns_figure, "Table")
 
         print("✅ Table created successfully!")
 
@@ -283,6 +778,8 @@ class VisualizationHandler:
         strategy (VisualizationStrategy | None): Seçili görselleştirme stratejisi.
         config (dict): Görselleştirme konfigürasyonu.
         strategies (dict): Mevcut stratejilerin haritası.
+        _ax (plt.Axes | None): Grafikler arasında yeniden kullanılan eksen.
+        _columns (list[str]): Prompt'larda sunulan kolon isimleri; bir kez alınır.
     """
 
     def __init__(self, file_handler: FileHandler):
@@ -300,6 +797,43 @@ class VisualizationHandler:
             # VisualizationType.HISTOGRAM: HistogramStrategy(),
             VisualizationType.TABLE: TableStrategy(),
         }
+        self._ax: plt.Axes | None = None
+        self._columns: list[str] = []
+        self.refresh_columns()
+
+    def refresh_columns(self):
+        """Prompt'larda sunulan kolon listesini file handler'dan yeniden alır.
+        
+        Kolonlar __init__'te bir kez alınır ve her prompt'ta tekrar
+        kullanılır. file_handler başka bir dosyaya çevrildikten sonra
+        prompt'lar o dosyanın kolonlarıyla açılacaksa çağrılmalıdır.
+        """
+        self._columns = self.file_handler.get_column_names()
+
+    def _get_axes(self) -> plt.Axes:
+        """Cache'lenmiş ekseni döndürür, yoksa (veya figür kapatıldıysa) oluşturur.
+        
+        Ardışık grafikler aynı figür/canvas üzerine çizilir; her grafik için
+        backend canvas'ı yeniden oluşturulup yıkılmaz.
+        
+        Returns:
+            plt.Axes: Çizim ekseni.
+        """
+        plt = _pyplot()
+        if self._ax is None or not plt.fignum_exists(self._ax.figure.number):
+            _, self._ax = plt.subplots(figsize=(10, 6), layout="constrained")
+        return self._ax
+
+    def close(self):
+        """Cache'lenmiş figürü kapatır.
+        
+        Handler'la işi biten taraf çağırmalıdır; eksen grafikler arasında
+        yeniden kullanıldığı için stratejiler bu figürü kapatmaz. Sonraki bir
+        çizimde _get_axes() yeni figür oluşturur.
+        """
+        if self._ax is not None:
+            _pyplot().close(self._ax.figure)
+            self._ax = None
 
     def set_strategy(self, viz_type: VisualizationType):
         """Görselleştirme tipine göre stratejiyi ayarlar.
@@ -339,7 +873,7 @@ class VisualizationHandler:
             return
 
         try:
-            self.strategy.create_visualization(data, self.config)
+            self.strategy.create_visualization(data, self.config, ax=self._get_axes())
         except Exception as e:
             print(f"❌ Error creating visualization: {str(e)}")
 
@@ -349,28 +883,22 @@ class VisualizationHandler:
         Returns:
             VisualizationType | None: Seçilen tür veya iptal durumunda None.
         """
-        try:
-            viz_types = list(VisualizationType)
-            choices = [viz_type.value for viz_type in viz_types]
+        from InquirerPy import inquirer
 
+        try:
             selected = inquirer.select(
                 message="Select Visualization Type:",
-                choices=choices,
-                default=choices[0],
+                choices=_VIZ_VALUES,
+                default=_VIZ_VALUES[0],
                 border=True,
                 qmark="🎨",
-                keybindings={
-                    "interrupt": [{"key": "q"}],
-                },
+                keybindings=_KEYBINDINGS,
             ).execute()
 
-            # Find the enum member by value
-            for viz_type in viz_types:
-                if viz_type.value == selected:
-                    print(f"✅ Selected: {selected}")
-                    return viz_type
-
-            return None
+            viz_type = _VIZ_BY_VALUE.get(selected)
+            if viz_type is not None:
+                print(f"✅ Selected: {selected}")
+            return viz_type
 
         except KeyboardInterrupt:
             print("\n👋 Exiting...")
@@ -390,7 +918,9 @@ class VisualizationHandler:
         Returns:
             dict: Oluşturulan konfigürasyon sözlüğü.
         """
-        columns = self.file_handler.get_column_names()
+        from InquirerPy import inquirer
+
+        columns = self._columns
 
         try:
             config = {}
@@ -434,17 +964,17 @@ class VisualizationHandler:
                 rows = inquirer.text(
                     message="Number of rows to display:",
                     default="10",
-                    validate=lambda x: x.isdigit() and int(x) > 0,
-                    invalid_message="Please enter a positive number",
+                    validate=lambda x: x.isdigit() and 0 < int(x) <= _MAX_TABLE_ROWS,
+                    invalid_message=f"Please enter a number between 1 and {_MAX_TABLE_ROWS}",
                     qmark="🔢",
-                    keybindings={"interrupt": [{"key": "q"}]},
+                    keybindings=_KEYBINDINGS,
                 ).execute()
 
                 title = inquirer.text(
                     message="Table title:",
                     default="Data Table",
                     qmark="📝",
-                    keybindings={"interrupt": [{"key": "q"}]},
+                    keybindings=_KEYBINDINGS,
                 ).execute()
 
                 config = {"rows": int(rows), "title": title}
@@ -459,7 +989,7 @@ class VisualizationHandler:
                     default=columns[0],
                     border=True,
                     qmark="📈",
-                    keybindings={"interrupt": [{"key": "q"}]},
+                    keybindings=_KEYBINDINGS,
                 ).execute()
 
                 # Y-axis
@@ -469,7 +999,7 @@ class VisualizationHandler:
                     default=columns[1] if len(columns) > 1 else columns[0],
                     border=True,
                     qmark="📊",
-                    keybindings={"interrupt": [{"key": "q"}]},
+                    keybindings=_KEYBINDINGS,
                 ).execute()
 
                 # Title
@@ -477,7 +1007,7 @@ class VisualizationHandler:
                     message="Chart title:",
                     default=viz_type.value,
                     qmark="📝",
-                    keybindings={"interrupt": [{"key": "q"}]},
+                    keybindings=_KEYBINDINGS,
                 ).execute()
 
                 config = {"x_axis": x_col, "y_axis": y_col, "title": title}
@@ -497,6 +1027,8 @@ class VisualizationHandler:
         3. Grafiği oluşturur.
         4. Başka grafik isteyip istemediğini sorar.
         """
+        from InquirerPy import inquirer
+
         self.file_handler.preview_data()
 
         while True:
@@ -517,7 +1049,7 @@ class VisualizationHandler:
                     message="Create another visualization for this file?",
                     default=False,
                     qmark="🔄",
-                    keybindings={"interrupt": [{"key": "q"}]},
+                    keybindings=_KEYBINDINGS,
                 ).execute()
 
                 if not another:
@@ -528,6 +1060,102 @@ class VisualizationHandler:
                 break
 
 
+def _init_render_worker():
+    """Render süreçlerinde Agg backend'ini zorunlu kılar.
+
+    Worker'lar ekran açamaz; grafikler her zaman dosyaya kaydedilir.
+    """
+    global _BACKEND, _IS_INTERACTIVE
+    import matplotlib
+
+    matplotlib.use("Agg")
+    matplotlib.rcParams.update(_RC_PARAMS)
+    _BACKEND = "Agg"
+    _IS_INTERACTIVE = False
+
+
+def _source_names(file_paths: list[str]) -> list[str]:
+    """Toplu çıktı dosya adlarında kullanılan kaynak dosya adlarını döndürür.
+    
+    Ad, dosyanın toplu işteki dosyaların ortak klasörüne göre yolundan
+    üretilir; klasör ayırıcıları ve noktalar alt çizgiye çevrilir (örn.
+    "a/data.csv" için "a_data_csv"). Uzantı da eklendiğinden aynı isimli CSV
+    ve TXT dosyaları, klasör eklendiğinden de özyinelemeli taramada farklı
+    klasörlerdeki aynı isimli dosyalar ayrışır. Yine de çakışan adlara sıra
+    numarası eklenir, böylece her dosyanın çıktısı ayrıdır.
+    
+    Args:
+        file_paths (list[str]): Kaynak dosya yolları.
+    
+    Returns:
+        list[str]: file_paths sırasıyla benzersiz kaynak adları.
+    """
+    if not file_paths:
+        return []
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in file_paths])
+
+    names: list[str] = []
+    seen: set[str] = set()
+    for file_path in file_paths:
+        relative = os.path.relpath(os.path.abspath(file_path), root)
+        base = relative.replace(os.sep, "_").replace(".", "_")
+        name, n = base, 1
+        while name in seen:
+            n += 1
+            name = f"{base}_{n}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def _worth_pooling(file_handlers: list[tuple[str, FileHandler]]) -> bool:
+    """Toplu çizimin süreç havuzunda yapılmaya değip değmeyeceğine karar verir.
+    
+    Tek çekirdekte veya tek dosyada havuz sadece worker başlatma maliyeti
+    ekler. Aksi halde en az _POOL_MIN_FILES dosya veya toplamda
+    _POOL_MIN_BYTES veri gerekir.
+    
+    Args:
+        file_handlers (list[tuple[str, FileHandler]]): (dosya yolu, handler)
+            çiftleri.
+    
+    Returns:
+        bool: Havuz kullanılacaksa True.
+    """
+    if (os.cpu_count() or 1) < 2 or len(file_handlers) < 2:
+        return False
+    if len(file_handlers) >= _POOL_MIN_FILES:
+        return True
+    total = sum(fh.file.get_stat().st_size for _, fh in file_handlers)
+    return total >= _POOL_MIN_BYTES
+
+
+def _render_one(job: tuple[str, str, dict]):
+    """Tek bir dosyanın grafiğini ayrı bir süreçte oluşturup kaydeder.
+
+    ProcessPoolExecutor'a gönderilebilmesi için modül seviyesindedir ve
+    sadece pickle'lanabilir argümanlar alır; dosya worker içinde yeniden
+    okunur.
+
+    Args:
+        job (tuple[str, str, dict]): (dosya yolu, VisualizationType değeri,
+            konfigürasyon) üçlüsü.
+    """
+    file_path, viz_type_value, config = job
+    ax = _prepare_axes(None, (10, 6))
+    try:
+        handler = VisualizationHandler(FileHandler(File(file_path)))
+        handler.set_strategy(VisualizationType(viz_type_value))
+        handler.strategy.create_visualization(
+            handler.file_handler.get_data(), config, ax=ax
+        )
+    except Exception as e:
+        print(f"❌ Error processing {file_path}: {str(e)}")
+    finally:
+        # Worker birden fazla iş alır; hata olsa da figür açık kalmaz
+        _pyplot().close(ax.figure)
+
+
 class VisualizationWorkflow:
     """Tüm görselleştirme iş akışını yöneten orchestrator sınıfı.
     
@@ -538,6 +1166,8 @@ class VisualizationWorkflow:
         file (File | None): Aktif dosya nesnesi.
         file_handler (FileHandler | None): Aktif dosya handler'ı.
         viz_handler (VisualizationHandler | None): Aktif görselleştirme handler'ı.
+        stat_results (dict[str, os.stat_result]): CLI'dan gelen, dosya yoluna
+            göre önceden alınmış stat sonuçları.
     """
 
     def __init__(self):
@@ -545,30 +1175,50 @@ class VisualizationWorkflow:
         self.file: File | None = None
         self.file_handler: FileHandler | None = None
         self.viz_handler: VisualizationHandler | None = None
+        self.stat_results: dict[str, os.stat_result] = {}
+
+    def _open_file(self, file_path: str) -> File:
+        """Dosya yolu için File nesnesi oluşturur.
+        
+        Yol için önceden alınmış bir stat sonucu varsa File'a aktarılır ve
+        validasyon ek stat yapmadan tamamlanır (dosya zaten os.scandir() ile
+        doğrulandı). Yoksa File oluşturulurken normal validasyon yapılır.
+        
+        Args:
+            file_path (str): Dosya yolu.
+        
+        Returns:
+            File: Validate edilmiş File nesnesi.
+        """
+        return File(file_path, self.stat_results.get(file_path))
 
-    def setup_file(self, file_path: str):
+    def setup_file(self, file_path: str, stat_result: os.stat_result | None = None):
         """Dosyayı ve file handler'ı hazırlar.
         
         Args:
             file_path (str): Dosya yolu.
+            stat_result (os.stat_result | None, optional): Önceden alınmış
+                stat sonucu. Verilirse dosya için tekrar stat yapılmaz.
         
         Raises:
-            SystemExit: Dosya tipi desteklenmiyorsa.
+            FileValidationError: Dosya bulunamazsa veya tipi desteklenmiyorsa.
+            FileReadError: Dosya açılamazsa.
         """
-        self.file = File(file_path)
-        self.file.__post_init__()  # Call validation
+        if stat_result is not None:
+            self.stat_results[file_path] = stat_result
+        self.file = self._open_file(file_path)
 
         if not self.file.validate_suffix():
-            sys.exit("❌ Unsupported file type")
+            raise FileValidationError("❌ Unsupported file type")
 
         metadata = self.file.get_metadata()
         print(f"\n📄 File Info:")
-        print(f"   Name: {metadata['name']}")
-        print(f"   Size: {metadata['size_kb']} KB")
-        print(f"   Type: {metadata['extension']}")
+        print(f"   Name: {metadata.name}")
+        print(f"   Size: {metadata.size_kb} KB")
+        print(f"   Type: {metadata.extension}")
 
         self.file_handler = FileHandler(self.file)
-        self.file_handler.read_file()
+        self.file_handler.scan_file()
 
     def setup_visualization(self):
         """Visualization handler'ı kurar ve interaktif akışı başlatır."""
@@ -577,7 +1227,10 @@ class VisualizationWorkflow:
             return
 
         self.viz_handler = VisualizationHandler(self.file_handler)
-        self.viz_handler.interactive_visualization()
+        try:
+            self.viz_handler.interactive_visualization()
+        finally:
+            self.viz_handler.close()
 
     def run(self, file_path: str):
         """Tek bir dosya için workflow'u çalıştırır.
@@ -585,16 +1238,21 @@ class VisualizationWorkflow:
         Args:
             file_path (str): Dosya yolu.
         """
-        print("\n" + "=" * 50)
-        print("🎨 VISUALIZATION WORKFLOW")
-        print("=" * 50)
+        sys.stdout.write(_SECTION_TEMPLATE.format("🎨 VISUALIZATION WORKFLOW"))
 
         self.setup_file(file_path)
-        self.setup_visualization()
+        try:
+            self.setup_visualization()
+        finally:
+            self.file_handler.close()
 
         print("\n✅ Workflow completed!")
 
-    def run_with_shared_config(self, file_paths: list[str]):
+    def run_with_shared_config(
+        self,
+        file_paths: list[str],
+        stat_results: dict[str, os.stat_result] | None = None,
+    ):
         """Birden fazla dosya için akıllı workflow'u çalıştırır.
         
         Kullanıcıya çalışma modu seçtirir:
@@ -604,10 +1262,24 @@ class VisualizationWorkflow:
         
         Args:
             file_paths (list[str]): Dosya yolları listesi.
+            stat_results (dict[str, os.stat_result] | None, optional): Dosya
+                yoluna göre önceden alınmış stat sonuçları (CLI'daki
+                os.scandir() taramasından). Bu dosyalar için tekrar stat
+                yapılmaz.
         """
-        print("\n" + "=" * 50)
-        print(f"🎨 SMART VISUALIZATION WORKFLOW - {len(file_paths)} FILES")
-        print("=" * 50)
+        if stat_results:
+            self.stat_results.update(stat_results)
+
+        file_paths = self._preflight(file_paths)
+        if not file_paths:
+            print("❌ No valid files to process")
+            return
+
+        sys.stdout.write(
+            _SECTION_TEMPLATE.format(
+                f"🎨 SMART VISUALIZATION WORKFLOW - {len(file_paths)} FILES"
+            )
+        )
 
         from InquirerPy import inquirer
 
@@ -620,7 +1292,7 @@ class VisualizationWorkflow:
             ],
             default="🔄 Same visualization for all files (recommended)",
             qmark="🤔",
-            keybindings={"interrupt": [{"key": "q"}]},
+            keybindings=_KEYBINDINGS,
         ).execute()
 
         if "Same visualization" in mode:
@@ -632,11 +1304,54 @@ class VisualizationWorkflow:
 
         print("\n✅ All files processed!")
 
+    def _preflight(self, file_paths: list[str]) -> list[str]:
+        """Dosyaları ağır I/O'dan önce ucuz kontrollerle elemeden geçirir.
+        
+        Her dosya için uzantı (saf string) ve tek bir os.stat kontrolü yapar.
+        CLI'dan stat sonucu gelen dosyalar için stat tekrarlanmaz. Alınan
+        stat sonuçları saklanır, böylece _open_file() tekrar validasyon
+        yapmaz. Atlanan dosyaların nedenleri tek seferde yazdırılır.
+        
+        Args:
+            file_paths (list[str]): Dosya yolları listesi.
+        
+        Returns:
+            list[str]: İşlenebilecek dosya yolları.
+        """
+        survivors = []
+        skipped = []
+        for file_path in file_paths:
+            name = os.path.basename(file_path)
+            if not File.has_valid_suffix(file_path):
+                skipped.append(f"⚠️  Skipping {name}: Unsupported file type")
+                continue
+
+            if file_path not in self.stat_results:
+                try:
+                    stat_result = os.stat(file_path)
+                except OSError as e:
+                    skipped.append(f"⚠️  Skipping {name}: {str(e)}")
+                    continue
+                if not stat.S_ISREG(stat_result.st_mode):
+                    skipped.append(f"⚠️  Skipping {name}: {FileError.NotFile.value}")
+                    continue
+                self.stat_results[file_path] = stat_result
+
+            survivors.append(file_path)
+
+        if skipped:
+            sys.stdout.write("\n".join(skipped) + "\n")
+
+        return survivors
+
     def _run_same_visualization_for_all(self, file_paths: list[str]):
         """Tüm dosyalar için aynı görselleştirme tipini uygular.
         
-        Önce tüm dosyaları yükler, sonra kullanıcıdan bir kez konfigürasyon alır
-        ve bu konfigürasyonu tüm dosyalara uygular.
+        Önce tüm dosyaların handler'larını hazırlar, sonra kullanıcıdan bir kez
+        konfigürasyon alır ve bu konfigürasyonu tüm dosyalara uygular. Prompt'lar
+        için sadece ilk dosya açılır; diğer dosyalar çizilecekleri sırada
+        okunur, böylece kullanıcı konfigürasyonda vazgeçerse hiçbir dosya boşuna
+        parse edilmez.
         
         Args:
             file_paths (list[str]): Dosya yolları listesi.
@@ -646,12 +1361,13 @@ class VisualizationWorkflow:
         file_handlers = []
         for file_path in file_paths:
             try:
-                file = File(file_path)
-                file.__post_init__()
+                file = self._open_file(file_path)
                 fh = FileHandler(file)
-                fh.read_file()
+                if not file_handlers:
+                    # Kolon prompt'ları ilk dosyanın şemasından gelir
+                    fh.scan_file()
                 file_handlers.append((file_path, fh))
-                print(f"  ✅ Loaded: {file.get_metadata()['name']}")
+                print(f"  ✅ Loaded: {file.get_metadata().name}")
             except Exception as e:
                 print(f"  ❌ Failed to load {file_path}: {str(e)}")
 
@@ -659,10 +1375,34 @@ class VisualizationWorkflow:
             print("❌ No files loaded successfully")
             return
 
-        _, first_handler = file_handlers[0]
-
-        viz_handler = VisualizationHandler(first_handler)
-
+        viz_handler = VisualizationHandler(file_handlers[0][1])
+        try:
+            self._render_same_for_all(viz_handler, file_handlers)
+        finally:
+            # Figür tüm dosyalar için paylaşıldı; iş bitince kapatılır. Çizilmeden
+            # kalan handler'ların (örn. ilk dosyanın Excel workbook'u) kaynakları
+            # da bırakılır
+            viz_handler.close()
+            for _, fh in file_handlers:
+                fh.close()
+
+    def _render_same_for_all(
+        self,
+        viz_handler: VisualizationHandler,
+        file_handlers: list[tuple[str, FileHandler]],
+    ):
+        """Konfigürasyonu bir kez sorup tüm dosyaların grafiğini oluşturur.
+        
+        Sıralı çizimde her dosyanın handler'ı file_handlers'tan çıkarılır ve
+        bir sonraki dosya okunmadan bırakılır; bellekte aynı anda tek dosyanın
+        verisi tutulur.
+        
+        Args:
+            viz_handler (VisualizationHandler): İlk dosyanın handler'ıyla
+                kurulmuş, tüm dosyalar için kullanılan görselleştirme handler'ı.
+            file_handlers (list[tuple[str, FileHandler]]): (dosya yolu,
+                handler) çiftleri; çizilen dosyalar listeden çıkarılır.
+        """
         # Kullanıcıdan visualization tipi al
         print("\n📊 All files will use the SAME visualization type and configuration")
         viz_type = viz_handler.prompt_visualization_type()
@@ -676,17 +1416,51 @@ class VisualizationWorkflow:
             return
 
         print(f"\n🚀 Creating {viz_type.value} for all {len(file_handlers)} files...\n")
+        sources = _source_names([file_path for file_path, _ in file_handlers])
+
+        _pyplot()
+        if not _IS_INTERACTIVE and _worth_pooling(file_handlers):
+            # Dosyaya kaydetme modunda her dosyanın çizimi bağımsızdır;
+            # Agg thread-safe olmadığı için ayrı süreçlerde paralel çizilir.
+            # fork, Polars'ın thread havuzu kilitlerini kopyalayıp worker'ı
+            # kilitleyebildiği için süreçler spawn ile başlatılır.
+            jobs = [
+                (file_path, viz_type.value, {**config, "source": source})
+                for (file_path, _), source in zip(file_handlers, sources)
+            ]
+            # Her iş kendi kaynak dosyası adıyla ayrı bir çıktıya yazar; işler
+            # birbirinin dosyasına dokunmadan eşzamanlı çalışabilir. Her spawn
+            # worker'ı pandas/matplotlib'i yeniden import eder; dosyadan fazla
+            # süreç başlatılmaz.
+            with ProcessPoolExecutor(
+                max_workers=min(len(jobs), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_render_worker,
+            ) as executor:
+                list(executor.map(_render_one, jobs))
+            return
+
+        total = len(file_handlers)
+        for i, source in enumerate(sources, 1):
+            file_path, fh = file_handlers.pop(0)
+            name = os.path.basename(file_path)
+            sys.stdout.write(_SECTION_TEMPLATE.format(f"📄 File {i}/{total}: {name}"))
 
-        for i, (file_path, fh) in enumerate(file_handlers, 1):
-            print(f"\n{'=' * 50}")
-            print(f"📄 File {i}/{len(file_handlers)}: {Path(file_path).name}")
-            print(f"{'=' * 50}")
+            # Aynı handler (ve cache'lenmiş figürü) her dosya için kullanılır;
+            # önceki dosyanın verisi yenisi okunmadan bırakılır
+            viz_handler.file_handler = fh
+            try:
+                # Polars ile tembel açılan CSV/TXT'de parse hatası ancak
+                # veri okunurken çıkar; hatalı dosya burada atlanır
+                fh.get_data()
+            except Exception as e:
+                print(f"  ❌ Failed to load {file_path}: {str(e)}")
+                continue
+            finally:
+                fh.close()
 
-            # Her dosya için yeni handler oluştur ama aynı config kullan
-            temp_viz_handler = VisualizationHandler(fh)
-            temp_viz_handler.set_strategy(viz_type)
-            temp_viz_handler.config = config.copy()
-            temp_viz_handler.create_visualization()
+            viz_handler.config = {**config, "source": source}
+            viz_handler.create_visualization()
 
     def _run_different_visualization_for_each(self, file_paths: list[str]):
         """Her dosya için ayrı ayrı görselleştirme akışı çalıştırır.
@@ -696,10 +1470,9 @@ class VisualizationWorkflow:
         """
         print("\n📋 Each file will have its own visualization configuration\n")
 
+        total = len(file_paths)
         for i, file_path in enumerate(file_paths, 1):
-            print(f"\n{'=' * 50}")
-            print(f"📄 File {i}/{len(file_paths)}")
-            print(f"{'=' * 50}")
+            sys.stdout.write(_SECTION_TEMPLATE.format(f"📄 File {i}/{total}"))
 
             try:
                 self.setup_file(file_path)
@@ -710,11 +1483,18 @@ class VisualizationWorkflow:
             except Exception as e:
                 print(f"❌ Error processing {file_path}: {str(e)}")
                 continue
+            finally:
+                # Dosyanın verisi bir sonraki dosya okunmadan bırakılır
+                if self.file_handler is not None:
+                    self.file_handler.close()
+                self.file_handler = self.viz_handler = None
 
     def _run_comparison(self, file_paths: list[str]):
         """Dosyaları yan yana karşılaştırmalı olarak görselleştirir.
         
         Ortak kolonları bulur ve seçilen kolon üzerinden karşılaştırma grafiği çizer.
+        Ortak kolonlar sadece dosya başlıklarından bulunur; veriden yalnızca
+        seçilen X ve Y kolonları okunur.
         
         Args:
             file_paths (list[str]): Dosya yolları listesi.
@@ -726,14 +1506,20 @@ class VisualizationWorkflow:
         all_data = []
         for file_path in file_paths:
             try:
-                file = File(file_path)
-                file.__post_init__()
+                file = self._open_file(file_path)
                 fh = FileHandler(file)
-                data = fh.read_file()
+                columns = fh.read_columns_only()
+                # Prompt'lar sürerken Excel workbook'u açık tutulmaz; seçilen
+                # kolonlar okunurken yeniden açılır
+                fh.close()
                 all_data.append(
-                    {"name": file.get_metadata()["name"], "data": data, "handler": fh}
+                    {
+                        "name": file.get_metadata().name,
+                        "columns": pd.Index(columns),
+                        "handler": fh,
+                    }
                 )
-                print(f"  ✅ Loaded: {file.get_metadata()['name']}")
+                print(f"  ✅ Loaded: {file.get_metadata().name}")
             except Exception as e:
                 print(f"  ❌ Failed: {file_path}")
 
@@ -741,73 +1527,131 @@ class VisualizationWorkflow:
             print("❌ Need at least 2 files for comparison")
             return
 
-        common_columns = set(all_data[0]["data"].columns)
+        common = all_data[0]["columns"]
         for item in all_data[1:]:
-            common_columns &= set(item["data"].columns)
+            common = common.intersection(item["columns"])
 
-        if not common_columns:
+        if common.empty:
             print("❌ No common columns found across all files")
             return
 
-        common_columns = sorted(list(common_columns))
+        common_columns = sorted(common)
         print(f"\n📋 Common columns: {', '.join(common_columns)}")
 
-        viz_types = [VisualizationType.LINE_CHART, VisualizationType.BAR_CHART]
-        choices = [vt.value for vt in viz_types]
-
         selected = inquirer.select(
             message="Select comparison chart type:",
-            choices=choices,
+            choices=_COMPARISON_VIZ_VALUES,
             qmark="🎨",
-            keybindings={"interrupt": [{"key": "q"}]},
+            keybindings=_KEYBINDINGS,
         ).execute()
 
         x_col = inquirer.select(
             message="X-axis:",
             choices=common_columns,
             qmark="📈",
-            keybindings={"interrupt": [{"key": "q"}]},
+            keybindings=_KEYBINDINGS,
         ).execute()
 
         y_col = inquirer.select(
             message="Y-axis to compare:",
             choices=common_columns,
             qmark="📊",
-            keybindings={"interrupt": [{"key": "q"}]},
+            keybindings=_KEYBINDINGS,
         ).execute()
 
         print(f"\n🚀 Creating comparison {selected}...")
 
-        plt.figure(figsize=(12, 7))
-
+        # Sadece isim ve iki kolonun NumPy dizileri tutulur; DataFrame'ler
+        # çizimden önce bırakılır.
+        series: list[tuple[str, np.ndarray, np.ndarray]] = []
         for item in all_data:
-            data = item["data"]
-            if x_col in data.columns and y_col in data.columns:
-                if "Line" in selected:
-                    plt.plot(
-                        data[x_col],
-                        data[y_col],
-                        marker="o",
-                        label=item["name"],
-                        linewidth=2,
+            try:
+                data = item["handler"].read_columns([x_col, y_col])
+            except Exception as e:
+                print(f"  ❌ Failed to read {item['name']}: {str(e)}")
+                continue
+            finally:
+                item["handler"].close()
+            xs, ys = data[x_col].to_numpy(), data[y_col].to_numpy()
+            if len(data) > 4 * _LTTB_TARGET:
+                # Piksel sayısından çok nokta çizmek görüntüyü değiştirmez
+                downsampled = lttb_series(data[x_col], data[y_col], _LTTB_TARGET)
+                if downsampled is not None:
+                    xs, ys = downsampled
+            series.append((item["name"], xs, ys))
+        del all_data
+
+        plt = _pyplot()
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+
+        fig, ax = plt.subplots(figsize=(12, 7), layout="constrained")
+        try:
+            if "Line" in selected:
+                colors = [f"C{i}" for i in range(len(series))]
+                # Çok noktada marker'lar tek tek çizilir ve sadeleştirmeyi kapatır
+                n_points = sum(len(xs) for _, xs, _ in series)
+                marker = "o" if n_points <= _MARKER_LIMIT else None
+                numeric = all(
+                    np.issubdtype(xs.dtype, np.number)
+                    and np.issubdtype(ys.dtype, np.number)
+                    for _, xs, ys in series
+                )
+                if numeric:
+                    # Tüm dosyalar tek bir collection (çizgiler) ve tek bir scatter
+                    # (noktalar) olarak çizilir; dosya başına ayrı artist oluşmaz.
+                    segments = [np.column_stack([xs, ys]) for _, xs, ys in series]
+                    ax.add_collection(
+                        LineCollection(segments, colors=colors, linewidths=2)
+                    )
+                    if marker is not None:
+                        ax.scatter(
+                            np.concatenate([xs for _, xs, _ in series]),
+                            np.concatenate([ys for _, _, ys in series]),
+                            c=np.repeat(colors, [len(xs) for _, xs, _ in series]),
+                            s=36,
+                            zorder=3,
+                        )
+                    ax.autoscale_view()
+                    ax.legend(
+                        handles=[
+                            Line2D([0], [0], color=color, marker=marker, linewidth=2)
+                            for color in colors
+                        ],
+                        labels=[name for name, _, _ in series],
                     )
                 else:
-                    # Bar chart için offset gerekir
-                    pass  # Şimdilik sadece line chart
-
-        plt.xlabel(x_col, fontsize=12)
-        plt.ylabel(y_col, fontsize=12)
-        plt.title(f"Comparison: {y_col} across files", fontsize=14, fontweight="bold")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-
-        if matplotlib.get_backend() != "Agg":
-            plt.show()
-        else:
-            filename = f"comparison_{y_col}.png"
-            plt.savefig(filename, dpi=150, bbox_inches="tight")
-            print(f"✅ Comparison saved as: {filename}")
-            plt.close()
+                    # Kategorik/datetime X ekseni birim dönüşümü gerektirir;
+                    # LineCollection bunu yapmadığı için Line2D kullanılır.
+                    padded = _pad_series(series)
+                    if padded is not None:
+                        lines = ax.plot(*padded, marker=marker, linewidth=2)
+                        ax.legend(lines, [name for name, _, _ in series])
+                    else:
+                        for (name, xs, ys), color in zip(series, colors):
+                            ax.plot(
+                                xs,
+                                ys,
+                                marker=marker,
+                                label=name,
+                                linewidth=2,
+                                color=color,
+                            )
+                        ax.legend()
+            else:
+                # Bar chart için offset gerekir
+                pass  # Şimdilik sadece line chart
+
+            ax.set_xlabel(x_col, fontsize=12)
+            ax.set_ylabel(y_col, fontsize=12)
+            ax.set_title(
+                f"Comparison: {y_col} across files", fontsize=14, fontweight="bold"
+            )
+            ax.grid(True, alpha=0.3)
+
+            _show_or_save(fig, f"comparison_{y_col}.png", {}, False, "Comparison")
+        finally:
+            # Çizim sırasında hata olsa da figür pyplot'ta açık kalmaz
+            plt.close(fig)
 
         print("✅ Comparison chart created!")